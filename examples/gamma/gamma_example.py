@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+
 from polymarket_kit.gamma import (
-    GammaClient,
+    AsyncGammaClient,
     SearchQuery,
     SeriesQuery,
     TagQuery,
@@ -18,40 +20,48 @@ def extract_event_id(event_id: str) -> int | None:
         return None
 
 
-def main() -> None:
+async def main() -> None:
     print("Testing Python Polymarket Gamma SDK")
 
-    with GammaClient() as client:
+    async with AsyncGammaClient() as client:
         print("\n1. Testing health check...")
         try:
-            health = client.get_health()
+            health = await client.get_health()
             print(f"OK: Health check passed: {health}")
         except Exception as exc:
             print(f"Health check failed: {exc}")
 
+        # Steps 2-6 are independent, so issue them concurrently
+        teams, tags, events, markets, series = await asyncio.gather(
+            client.get_teams(TeamQuery(limit=5, league=["NFL"], ascending=True)),
+            client.get_tags(TagQuery(limit=10, ascending=False)),
+            client.get_events(UpdatedEventQuery(limit=5, active=True, ascending=False)),
+            client.get_markets(UpdatedMarketQuery(limit=5, active=True)),
+            client.get_series(SeriesQuery(limit=5, offset=0, closed=False)),
+            return_exceptions=True,
+        )
+
         print("\n2. Testing teams API...")
-        try:
-            teams = client.get_teams(TeamQuery(limit=5, league=["NFL"], ascending=True))
+        if isinstance(teams, Exception):
+            print(f"Failed to get teams: {teams}")
+        else:
             print(f"OK: Found {len(teams)} teams")
             if teams:
                 print(f"   First team: {teams[0].name} ({teams[0].league})")
-        except Exception as exc:
-            print(f"Failed to get teams: {exc}")
 
         print("\n3. Testing tags API...")
-        try:
-            tags = client.get_tags(TagQuery(limit=10, ascending=False))
+        if isinstance(tags, Exception):
+            print(f"Failed to get tags: {tags}")
+        else:
             print(f"OK: Found {len(tags)} tags")
             if tags:
                 print(f"   First tag: {tags[0].label} ({tags[0].slug})")
-        except Exception as exc:
-            print(f"Failed to get tags: {exc}")
 
         print("\n4. Testing events API...")
-        try:
-            events = client.get_events(
-                UpdatedEventQuery(limit=5, active=True, ascending=False)
-            )
+        if isinstance(events, Exception):
+            print(f"Failed to get events: {events}")
+            events = []
+        else:
             print(f"OK: Found {len(events)} events")
             if events:
                 event = events[0]
@@ -59,35 +69,32 @@ def main() -> None:
                 print(f"   Markets: {len(event.markets)}")
                 if event.markets:
                     print(f"   First market: {event.markets[0].question}")
-        except Exception as exc:
-            print(f"Failed to get events: {exc}")
-            events = []
 
         print("\n5. Testing markets API...")
-        try:
-            markets = client.get_markets(UpdatedMarketQuery(limit=5, active=True))
+        if isinstance(markets, Exception):
+            print(f"Failed to get markets: {markets}")
+        else:
             print(f"OK: Found {len(markets)} markets")
             if markets:
                 market = markets[0]
                 print(f"   First market: {market.question}")
                 print(f"   Outcomes: {market.outcomes}")
                 print(f"   Active: {market.active}")
-        except Exception as exc:
-            print(f"Failed to get markets: {exc}")
 
         print("\n6. Testing series API...")
-        try:
-            series = client.get_series(SeriesQuery(limit=5, offset=0, closed=False))
+        if isinstance(series, Exception):
+            print(f"Failed to get series: {series}")
+        else:
             print(f"OK: Found {len(series)} series")
             if series:
                 ticker = series[0].ticker or ""
                 print(f"   First series: {series[0].title} ({ticker})")
-        except Exception as exc:
-            print(f"Failed to get series: {exc}")
 
         print("\n7. Testing search API...")
         try:
-            search_results = client.search(SearchQuery(q="election", limit_per_type=3))
+            search_results = await client.search(
+                SearchQuery(q="election", limit_per_type=3)
+            )
             events_count = len(search_results.events or [])
             tags_count = len(search_results.tags or [])
             profiles_count = len(search_results.profiles or [])
@@ -100,26 +107,30 @@ def main() -> None:
 
         print("\n8. Testing convenience methods...")
         try:
-            active_events = client.get_active_events(UpdatedEventQuery(limit=3))
+            active_events = await client.get_active_events(UpdatedEventQuery(limit=3))
             print(f"OK: Found {len(active_events)} active events")
         except Exception as exc:
             print(f"Failed to get active events: {exc}")
 
         try:
-            featured_events = client.get_featured_events(UpdatedEventQuery(limit=3))
+            featured_events = await client.get_featured_events(
+                UpdatedEventQuery(limit=3)
+            )
             print(f"OK: Found {len(featured_events)} featured events")
         except Exception as exc:
             print(f"Failed to get featured events: {exc}")
 
         try:
-            active_markets = client.get_active_markets(UpdatedMarketQuery(limit=3))
+            active_markets = await client.get_active_markets(
+                UpdatedMarketQuery(limit=3)
+            )
             print(f"OK: Found {len(active_markets)} active markets")
         except Exception as exc:
             print(f"Failed to get active markets: {exc}")
 
         print("\n9. Testing specific item retrieval...")
         try:
-            tag = client.get_tag_by_slug("politics")
+            tag = await client.get_tag_by_slug("politics")
             if tag is not None:
                 print(f"OK: Found tag: {tag.label} (ID: {tag.id})")
             else:
@@ -128,18 +139,27 @@ def main() -> None:
             print(f"Failed to get tag by slug: {exc}")
 
         if events:
-            event_id = extract_event_id(events[0].id)
-            if event_id is not None:
-                try:
-                    event = client.get_event_by_id(event_id)
+            event_ids = [
+                event_id
+                for event_id in (extract_event_id(event.id) for event in events)
+                if event_id is not None
+            ]
+            try:
+                by_id, event_tags = await asyncio.gather(
+                    client.get_events_by_ids(event_ids),
+                    client.get_event_tags_batch(event_ids),
+                )
+                found = sum(event is not None for event in by_id)
+                print(f"OK: Found {found}/{len(event_ids)} events by ID")
+                for event, tags in zip(by_id, event_tags):
                     if event is not None:
-                        print(f"OK: Found event by ID: {event.title}")
-                except Exception as exc:
-                    print(f"Failed to get event by ID: {exc}")
+                        print(f"   {event.title}: {len(tags)} tags")
+            except Exception as exc:
+                print(f"Failed to get events by ID: {exc}")
 
             if events[0].slug:
                 try:
-                    event = client.get_event_by_slug(events[0].slug)
+                    event = await client.get_event_by_slug(events[0].slug)
                     if event is not None:
                         print(f"OK: Found event by slug: {event.title}")
                 except Exception as exc:
@@ -149,4 +169,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
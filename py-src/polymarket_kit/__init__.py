@@ -1,9 +1,10 @@
-from .gamma import GammaClient, GammaRequestError, GammaSDK, ProxyConfig
+from .gamma import AsyncGammaClient, GammaClient, GammaRequestError, GammaSDK, ProxyConfig
 from .clob import ClobClient, ClobRequestError, ClobSDK, OrderResponse, PriceHistoryResponse, TradingClient
 from .profile import extract_wallet_address_from_profile
 from .ws import ApiCreds, PolymarketWebSocket
 
 __all__ = [
+    "AsyncGammaClient",
     "GammaClient",
     "GammaRequestError",
     "GammaSDK",
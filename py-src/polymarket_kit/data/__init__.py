@@ -1,3 +1,4 @@
+from .async_client import AsyncDataClient, AsyncDataSDK
 from .client import DataClient, DataRequestError, DataSDK
 from .models import (
     Activity,
@@ -6,6 +7,7 @@ from .models import (
     DataHealthResponse,
     DataModel,
     DataTrade,
+    FastDumpQuery,
     Holder,
     LiveVolumeMarket,
     LiveVolumeQuery,
@@ -16,16 +18,18 @@ from .models import (
     Position,
     PositionsQuery,
     ProxyConfig,
-    TradesQuery,
+    TopHoldersQuery,
     TotalMarketsTraded,
     TotalMarketsTradedQuery,
     TotalValue,
     TotalValueQuery,
-    TopHoldersQuery,
+    TradesQuery,
     UserActivityQuery,
 )
 
 __all__ = [
+    "AsyncDataClient",
+    "AsyncDataSDK",
     "DataClient",
     "DataRequestError",
     "DataSDK",
@@ -35,6 +39,7 @@ __all__ = [
     "DataHealthResponse",
     "DataModel",
     "DataTrade",
+    "FastDumpQuery",
     "Holder",
     "LiveVolumeMarket",
     "LiveVolumeQuery",
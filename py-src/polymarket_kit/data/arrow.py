@@ -0,0 +1,119 @@
+"""
+Columnar (Apache Arrow) views of Data API results
+
+Converts lists of response models into ``pyarrow.Table`` objects so analytics
+such as ``table["currentValue"].sum()`` run in Arrow's vectorized kernels
+instead of walking Python attributes one object at a time.
+
+Requires the optional ``pyarrow`` dependency::
+
+    pip install "polymarket-kit[arrow]"
+"""
+
+from __future__ import annotations
+
+import functools
+import types
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .models import Activity, ClosedPosition, DataTrade, Position
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for Arrow conversion; install it with "
+            '`pip install "polymarket-kit[arrow]"`'
+        ) from exc
+    return pyarrow
+
+
+def _arrow_type(pa: Any, annotation: Any) -> Any:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return _arrow_type(pa, members[0])
+        if all(member in (int, float) for member in members):
+            return pa.float64()
+        return pa.string()
+    if origin is Literal:
+        return pa.string()
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    return pa.string()
+
+
+@functools.cache
+def schema_for(model: type[BaseModel]) -> pyarrow.Schema:
+    """Arrow schema mirroring ``model``'s fields, built once per model class."""
+    pa = _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field(name, _arrow_type(pa, field.annotation), nullable=True)
+            for name, field in model.model_fields.items()
+        ]
+    )
+
+
+def to_arrow(items: Sequence[BaseModel], model: type[BaseModel]) -> pyarrow.Table:
+    """
+    Convert a list of models into a ``pyarrow.Table`` with one column per field
+
+    Args:
+        items: Models to convert (instances of ``model`` or its subclasses)
+        model: Model class whose fields define the table schema
+
+    Returns:
+        pyarrow.Table: Columnar copy of ``items``
+
+    Example:
+        ```python
+        table = to_arrow(data.get_current_positions({"user": "0x123..."}), Position)
+        print(table["currentValue"].to_pylist())
+        ```
+    """
+    pa = _require_pyarrow()
+    schema = schema_for(model)
+    columns: dict[str, list[Any]] = {}
+    for field in schema:
+        name = field.name
+        column = [getattr(item, name) for item in items]
+        if pa.types.is_string(field.type):
+            column = [None if value is None else str(value) for value in column]
+        elif pa.types.is_floating(field.type):
+            column = [None if value is None else float(value) for value in column]
+        columns[name] = column
+    return pa.Table.from_pydict(columns, schema=schema)
+
+
+def positions_to_arrow(positions: Sequence[Position]) -> pyarrow.Table:
+    """Columnar view of ``get_current_positions`` results"""
+    return to_arrow(positions, Position)
+
+
+def closed_positions_to_arrow(positions: Sequence[ClosedPosition]) -> pyarrow.Table:
+    """Columnar view of ``get_closed_positions`` results"""
+    return to_arrow(positions, ClosedPosition)
+
+
+def trades_to_arrow(trades: Sequence[DataTrade]) -> pyarrow.Table:
+    """Columnar view of ``get_trades`` results"""
+    return to_arrow(trades, DataTrade)
+
+
+def activity_to_arrow(activity: Sequence[Activity]) -> pyarrow.Table:
+    """Columnar view of ``get_user_activity`` results"""
+    return to_arrow(activity, Activity)
@@ -0,0 +1,340 @@
+"""
+Polymarket Data API async SDK Client
+
+Asynchronous counterpart of :class:`~polymarket_kit.data.client.DataClient`
+built on ``httpx.AsyncClient``. Independent requests issued by the
+convenience helpers run concurrently over the shared connection pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from typing import Any
+
+import httpx
+import orjson
+from pydantic import BaseModel
+
+from .client import (
+    _ACTIVITY_LIST_ADAPTER,
+    _CLOSED_POSITION_LIST_ADAPTER,
+    _META_HOLDER_LIST_ADAPTER,
+    _OPEN_INTEREST_LIST_ADAPTER,
+    _POSITION_LIST_ADAPTER,
+    _TOTAL_VALUE_LIST_ADAPTER,
+    _TRADE_LIST_ADAPTER,
+    DEFAULT_BASE_URL,
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    DataRequestError,
+    _construct_live_volume,
+    _error_data,
+    _normalize_params,
+    _parse_markets_traded,
+    _TTLCache,
+    _with_query,
+    cacheable,
+)
+from .models import (
+    Activity,
+    ClosedPosition,
+    ClosedPositionsQuery,
+    DataHealthResponse,
+    DataTrade,
+    LiveVolumeQuery,
+    LiveVolumeResponse,
+    MetaHolder,
+    OpenInterest,
+    OpenInterestQuery,
+    Position,
+    PositionsQuery,
+    ProxyConfig,
+    TopHoldersQuery,
+    TotalMarketsTraded,
+    TotalMarketsTradedQuery,
+    TotalValue,
+    TotalValueQuery,
+    TradesQuery,
+    UserActivityQuery,
+)
+
+
+class AsyncDataClient:
+    """
+    Asynchronous Polymarket Data API SDK
+
+    Exposes the same methods as ``DataClient`` as coroutines. Create one
+    instance and reuse it; each instance owns a pooled ``httpx.AsyncClient``.
+    ``trust_server`` behaves as it does on ``DataClient``.
+
+    Example:
+        ```python
+        async with AsyncDataClient() as data:
+            summary = await data.get_portfolio_summary("0x123...")
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        proxy: ProxyConfig | str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        headers: Mapping[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        trust_server: bool = False,
+        cache_ttl: float = 0.0,
+    ) -> None:
+        self._trust_server = trust_server
+        self._cache = _TTLCache(cache_ttl)
+        if client is not None:
+            self._client = client
+            self._owns_client = False
+            return
+
+        proxy_url: str | None = None
+        if isinstance(proxy, ProxyConfig):
+            proxy_url = proxy.url
+        elif isinstance(proxy, str):
+            proxy_url = proxy
+
+        default_headers = {
+            "User-Agent": "polymarket-kit/0.1.0",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+        if headers:
+            default_headers.update(headers)
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            headers=default_headers,
+            proxy=proxy_url,
+            http2=True,
+            limits=DEFAULT_LIMITS,
+        )
+        self._owns_client = True
+
+    async def __aenter__(self) -> AsyncDataClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._client
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
+    async def _request(
+        self, endpoint: str, query_string: str
+    ) -> tuple[httpx.Response, bytes | None]:
+        ttl = self._cache.effective_ttl()
+        if ttl > 0:
+            cache_key = self._cache.key(endpoint, query_string)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return httpx.Response(200, content=cached), cached
+
+        response = await self._client.get(_with_query(endpoint, query_string))
+        if response.status_code == 204 or not response.content:
+            return response, None
+
+        content = response.content
+        if ttl > 0 and response.is_success:
+            self._cache.set(cache_key, content, ttl)
+        return response, content
+
+    async def _get_bytes(
+        self, endpoint: str, query: BaseModel | Mapping[str, Any] | None, operation: str
+    ) -> bytes:
+        return await self._get_data_with_params(
+            endpoint, _normalize_params(query), operation
+        )
+
+    async def _get_data_with_params(
+        self, endpoint: str, query_string: str, operation: str
+    ) -> bytes:
+        """Like ``_get_bytes`` for a query already encoded by ``_normalize_params``."""
+        response, content = await self._request(endpoint, query_string)
+        if not response.is_success:
+            raise DataRequestError(
+                f"[AsyncDataSDK] {operation} failed: status {response.status_code}",
+                status_code=response.status_code,
+                error_data=_error_data(response),
+            )
+        if content is None:
+            raise DataRequestError(
+                f"[AsyncDataSDK] {operation} returned null data despite successful response",
+                status_code=response.status_code,
+            )
+        return content
+
+    # Health Check API
+    async def health_check(self) -> DataHealthResponse:
+        """Health check for the Data API"""
+        content = await self._get_bytes("/", None, "Health check")
+        if self._trust_server:
+            return DataHealthResponse.model_construct(**orjson.loads(content))
+        return DataHealthResponse.model_validate_json(content)
+
+    # Positions API
+    async def get_current_positions(
+        self, query: PositionsQuery | Mapping[str, Any]
+    ) -> list[Position]:
+        """Get current positions for a user"""
+        content = await self._get_bytes("/positions", query, "Get current positions")
+        return _POSITION_LIST_ADAPTER.validate_json(content)
+
+    async def get_closed_positions(
+        self, query: ClosedPositionsQuery | Mapping[str, Any]
+    ) -> list[ClosedPosition]:
+        """Get closed positions for a user"""
+        content = await self._get_bytes(
+            "/closed-positions", query, "Get closed positions"
+        )
+        return _CLOSED_POSITION_LIST_ADAPTER.validate_json(content)
+
+    # Trades API
+    async def get_trades(
+        self, query: TradesQuery | Mapping[str, Any] | None = None
+    ) -> list[DataTrade]:
+        """Get trades for a user or markets"""
+        content = await self._get_bytes("/trades", query, "Get trades")
+        return _TRADE_LIST_ADAPTER.validate_json(content)
+
+    # User Activity API
+    async def get_user_activity(
+        self, query: UserActivityQuery | Mapping[str, Any]
+    ) -> list[Activity]:
+        """Get user activity"""
+        content = await self._get_bytes("/activity", query, "Get user activity")
+        return _ACTIVITY_LIST_ADAPTER.validate_json(content)
+
+    # Holders API
+    @cacheable(ttl=30)
+    async def get_top_holders(
+        self, query: TopHoldersQuery | Mapping[str, Any]
+    ) -> list[MetaHolder]:
+        """Get top holders for markets"""
+        content = await self._get_bytes("/holders", query, "Get top holders")
+        return _META_HOLDER_LIST_ADAPTER.validate_json(content)
+
+    # Value API
+    async def get_total_value(
+        self, query: TotalValueQuery | Mapping[str, Any]
+    ) -> list[TotalValue]:
+        """Get total value of a user's positions"""
+        content = await self._get_bytes("/value", query, "Get total value")
+        return _TOTAL_VALUE_LIST_ADAPTER.validate_json(content)
+
+    # Markets Traded API
+    async def get_total_markets_traded(
+        self, query: TotalMarketsTradedQuery | Mapping[str, Any]
+    ) -> TotalMarketsTraded:
+        """Get total markets a user has traded"""
+        content = await self._get_bytes("/traded", query, "Get total markets traded")
+        return _parse_markets_traded(content, self._trust_server)
+
+    # Open Interest API
+    @cacheable(ttl=30)
+    async def get_open_interest(
+        self, query: OpenInterestQuery | Mapping[str, Any]
+    ) -> list[OpenInterest]:
+        """Get open interest for markets"""
+        content = await self._get_bytes("/oi", query, "Get open interest")
+        return _OPEN_INTEREST_LIST_ADAPTER.validate_json(content)
+
+    # Live Volume API
+    @cacheable(ttl=30)
+    async def get_live_volume(
+        self, query: LiveVolumeQuery | Mapping[str, Any]
+    ) -> LiveVolumeResponse:
+        """Get live volume for an event"""
+        content = await self._get_bytes("/live-volume", query, "Get live volume")
+        if self._trust_server:
+            return _construct_live_volume(orjson.loads(content))
+        return LiveVolumeResponse.model_validate_json(content)
+
+    # Convenience methods for common use cases
+
+    async def get_all_positions(
+        self,
+        user: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> dict[str, list[Position] | list[ClosedPosition]]:
+        """
+        Get all positions (current and closed) for a user
+
+        Both requests are issued concurrently.
+
+        Args:
+            user: User address
+            options: Optional query parameters
+
+        Returns:
+            dict with 'current' and 'closed' keys containing position lists
+        """
+        query_base: dict[str, Any] = {"user": user}
+        if options:
+            query_base.update(options)
+
+        params = _normalize_params(query_base)
+        current_content, closed_content = await asyncio.gather(
+            self._get_data_with_params("/positions", params, "Get current positions"),
+            self._get_data_with_params(
+                "/closed-positions", params, "Get closed positions"
+            ),
+        )
+        current = _POSITION_LIST_ADAPTER.validate_json(current_content)
+        closed = _CLOSED_POSITION_LIST_ADAPTER.validate_json(closed_content)
+
+        return {"current": current, "closed": closed}
+
+    async def get_portfolio_summary(self, user: str) -> dict[str, Any]:
+        """
+        Get comprehensive user portfolio summary
+
+        The three underlying requests are issued concurrently.
+
+        Args:
+            user: User address
+
+        Returns:
+            dict with 'totalValue', 'marketsTraded', and 'currentPositions' keys
+        """
+        # All three endpoints take just ``user``, so encode it once
+        params = _normalize_params(TotalValueQuery(user=user))
+        total_value_content, markets_traded_content, positions_content = (
+            await asyncio.gather(
+                self._get_data_with_params("/value", params, "Get total value"),
+                self._get_data_with_params(
+                    "/traded", params, "Get total markets traded"
+                ),
+                self._get_data_with_params(
+                    "/positions", params, "Get current positions"
+                ),
+            )
+        )
+        total_value = _TOTAL_VALUE_LIST_ADAPTER.validate_json(total_value_content)
+        markets_traded = _parse_markets_traded(
+            markets_traded_content, self._trust_server
+        )
+        current_positions = _POSITION_LIST_ADAPTER.validate_json(positions_content)
+
+        return {
+            "totalValue": total_value,
+            "marketsTraded": markets_traded,
+            "currentPositions": current_positions,
+        }
+
+
+AsyncDataSDK = AsyncDataClient
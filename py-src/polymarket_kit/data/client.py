@@ -8,9 +8,20 @@ health checks, positions, trades, user activity, holders, and more.
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+import atexit
+import functools
+import inspect
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, TypeVar
+from urllib.parse import quote, urlencode
 
 import httpx
+import ijson
+import orjson
 from pydantic import BaseModel, TypeAdapter
 
 from .models import (
@@ -19,6 +30,7 @@ from .models import (
     ClosedPositionsQuery,
     DataHealthResponse,
     DataTrade,
+    LiveVolumeMarket,
     LiveVolumeQuery,
     LiveVolumeResponse,
     MetaHolder,
@@ -27,17 +39,38 @@ from .models import (
     Position,
     PositionsQuery,
     ProxyConfig,
-    TradesQuery,
+    TopHoldersQuery,
     TotalMarketsTraded,
     TotalMarketsTradedQuery,
     TotalValue,
     TotalValueQuery,
-    TopHoldersQuery,
+    TradesQuery,
     UserActivityQuery,
 )
 
 DEFAULT_BASE_URL = "https://data-api.polymarket.com"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
+
+# TTL chosen by the @cacheable endpoint currently executing, if any
+_CACHE_TTL_OVERRIDE: ContextVar[float | None] = ContextVar(
+    "_CACHE_TTL_OVERRIDE", default=None
+)
+
+_POSITION_LIST_ADAPTER = TypeAdapter(list[Position])
+_CLOSED_POSITION_LIST_ADAPTER = TypeAdapter(list[ClosedPosition])
+_TRADE_LIST_ADAPTER = TypeAdapter(list[DataTrade])
+_ACTIVITY_LIST_ADAPTER = TypeAdapter(list[Activity])
+_META_HOLDER_LIST_ADAPTER = TypeAdapter(list[MetaHolder])
+_TOTAL_VALUE_LIST_ADAPTER = TypeAdapter(list[TotalValue])
+_OPEN_INTEREST_LIST_ADAPTER = TypeAdapter(list[OpenInterest])
+_TRADE_ADAPTER = TypeAdapter(DataTrade)
+_ACTIVITY_ADAPTER = TypeAdapter(Activity)
 
 
 class DataRequestError(RuntimeError):
@@ -55,26 +88,182 @@ def _stringify_param(value: Any) -> str:
     return str(value)
 
 
-def _normalize_params(query: Any) -> dict[str, Any]:
+def _normalize_params(query: Any) -> str:
+    """Encode a query model or mapping as a ready-to-send query string."""
     if query is None:
-        return {}
+        return ""
+
+    to_params = getattr(query, "__to_params__", None)
+    if to_params is not None and not query.__pydantic_extra__:
+        # Generated per query class, see FastDumpQuery
+        return urlencode(to_params(), doseq=True, quote_via=quote)
 
     if isinstance(query, BaseModel):
-        data = query.model_dump(exclude_none=True)
+        # mode="json" leaves only str/int/float/bool/list values; bools are the
+        # one scalar whose str() differs from the API's spelling
+        data = query.model_dump(exclude_none=True, mode="json")
+        params: dict[str, Any] = {
+            key: (
+                [item for item in value if item is not None]
+                if isinstance(value, list)
+                else "true" if value is True else "false" if value is False else value
+            )
+            for key, value in data.items()
+        }
     else:
-        data = dict(query)
+        params = {}
+        for key, value in dict(query).items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                # Lists repeat the key once per value
+                params[key] = [
+                    _stringify_param(item) for item in value if item is not None
+                ]
+            else:
+                params[key] = _stringify_param(value)
+
+    return urlencode(params, doseq=True, quote_via=quote)
+
+
+def _with_query(endpoint: str, query_string: str) -> str:
+    return f"{endpoint}?{query_string}" if query_string else endpoint
+
+
+def _error_data(response: httpx.Response) -> Any | None:
+    raw = response.content
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return raw.decode("utf-8", "replace")
+
+
+def cacheable(ttl: float) -> Callable[[_F], _F]:
+    """Cache an endpoint's responses for ``ttl`` seconds instead of ``cache_ttl``.
+
+    Only takes effect on clients created with ``cache_ttl > 0``.
+    """
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                token = _CACHE_TTL_OVERRIDE.set(ttl)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _CACHE_TTL_OVERRIDE.reset(token)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _CACHE_TTL_OVERRIDE.set(ttl)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _CACHE_TTL_OVERRIDE.reset(token)
+
+        return wrapper  # type: ignore[return-value]
 
-    params: dict[str, Any] = {}
-    for key, value in data.items():
-        if value is None:
-            continue
-        if isinstance(value, (list, tuple, set)):
-            # For lists, httpx will handle multiple values with the same key
-            params[key] = [_stringify_param(item) for item in value if item is not None]
-        else:
-            params[key] = _stringify_param(value)
+    return decorator
 
-    return params
+
+class _TTLCache:
+    """In-process cache of raw response bodies keyed by endpoint and query."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[float, bytes]] = {}
+
+    @staticmethod
+    def key(endpoint: str, query_string: str) -> tuple[str, str]:
+        return endpoint, query_string
+
+    def effective_ttl(self) -> float:
+        if self.ttl <= 0:
+            return 0.0
+        override = _CACHE_TTL_OVERRIDE.get()
+        return self.ttl if override is None else override
+
+    def get(self, key: tuple[str, str]) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return content
+
+    def set(self, key: tuple[str, str], content: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, content)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _parse_markets_traded(content: bytes, trusted: bool) -> TotalMarketsTraded:
+    if trusted:
+        return TotalMarketsTraded.model_construct(**orjson.loads(content))
+    return TotalMarketsTraded.model_validate_json(content)
+
+
+def _construct_live_volume(data: Mapping[str, Any]) -> LiveVolumeResponse:
+    return LiveVolumeResponse.model_construct(
+        total=data["total"],
+        markets=[LiveVolumeMarket.model_construct(**m) for m in data["markets"]],
+    )
+
+
+def _create_http_client(
+    *,
+    base_url: str = DEFAULT_BASE_URL,
+    timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+    headers: Mapping[str, str] | None = None,
+    proxy_url: str | None = None,
+) -> httpx.Client:
+    default_headers = {
+        "User-Agent": "polymarket-kit/0.1.0",
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate, br",
+    }
+    if headers:
+        default_headers.update(headers)
+
+    return httpx.Client(
+        base_url=base_url,
+        timeout=timeout,
+        headers=default_headers,
+        proxy=proxy_url,
+        http2=True,
+        limits=DEFAULT_LIMITS,
+    )
+
+
+_SHARED_CLIENT: httpx.Client | None = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client() -> httpx.Client:
+    """Process-wide ``httpx.Client`` used by default-configured ``DataClient``s."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                _SHARED_CLIENT = _create_http_client()
+    return _SHARED_CLIENT
+
+
+def _close_shared_client() -> None:
+    if _SHARED_CLIENT is not None:
+        _SHARED_CLIENT.close()
+
+
+atexit.register(_close_shared_client)
 
 
 class DataClient:
@@ -84,6 +273,20 @@ class DataClient:
     This SDK provides a comprehensive interface to the Polymarket Data API
     covering all available endpoints for user data, holdings, positions,
     trades, activity, and market analytics.
+
+    Clients built with the default ``base_url``, ``timeout``, ``headers`` and
+    ``proxy`` share one process-wide HTTP/2 connection pool, so creating many
+    short-lived ``DataClient()`` instances stays cheap; ``close()`` is a no-op
+    for them. Any custom connection setting gets a dedicated pool.
+
+    Pass ``trust_server=True`` to build the small single-object responses
+    (health, markets traded, live volume) with ``model_construct`` instead of
+    validating them. Only do this against the official API: malformed
+    payloads are stored as-is and no type coercion happens.
+
+    ``cache_ttl`` (seconds, disabled by default) keeps successful responses in
+    memory so identical requests skip the network; holders, open interest and
+    live volume use their own TTL once caching is enabled.
     """
 
     def __init__(
@@ -94,34 +297,39 @@ class DataClient:
         timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
         headers: Mapping[str, str] | None = None,
         client: httpx.Client | None = None,
+        trust_server: bool = False,
+        cache_ttl: float = 0.0,
     ) -> None:
+        self._trust_server = trust_server
+        self._cache = _TTLCache(cache_ttl)
         if client is not None:
             self._client = client
             self._owns_client = False
             return
 
+        if (
+            proxy is None
+            and headers is None
+            and base_url == DEFAULT_BASE_URL
+            and timeout == DEFAULT_TIMEOUT
+        ):
+            # Default configuration: share one pool across instances
+            self._client = _get_shared_client()
+            self._owns_client = False
+            return
+
         proxy_url: str | None = None
         if isinstance(proxy, ProxyConfig):
-            proxy_url = proxy.to_url()
+            proxy_url = proxy.url
         elif isinstance(proxy, str):
             proxy_url = proxy
 
-        default_headers = {
-            "User-Agent": "polymarket-kit/0.1.0",
-            "Content-Type": "application/json",
-        }
-        if headers:
-            default_headers.update(headers)
-
-        self._client = httpx.Client(
-            base_url=base_url,
-            timeout=timeout,
-            headers=default_headers,
-            proxy=proxy_url,
+        self._client = _create_http_client(
+            base_url=base_url, timeout=timeout, headers=headers, proxy_url=proxy_url
         )
         self._owns_client = True
 
-    def __enter__(self) -> "DataClient":
+    def __enter__(self) -> DataClient:
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -135,38 +343,83 @@ class DataClient:
         if self._owns_client:
             self._client.close()
 
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
     def _request(
-        self, endpoint: str, query: BaseModel | Mapping[str, Any] | None
-    ) -> tuple[httpx.Response, Any | None]:
-        response = self._client.get(endpoint, params=_normalize_params(query))
-        if response.status_code == 204:
+        self, endpoint: str, query_string: str
+    ) -> tuple[httpx.Response, bytes | None]:
+        ttl = self._cache.effective_ttl()
+        if ttl > 0:
+            cache_key = self._cache.key(endpoint, query_string)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return httpx.Response(200, content=cached), cached
+
+        response = self._client.get(_with_query(endpoint, query_string))
+        if response.status_code == 204 or not response.content:
             return response, None
 
-        data: Any | None = None
-        if response.content:
-            try:
-                data = response.json()
-            except ValueError:
-                data = response.text
+        content = response.content
+        if ttl > 0 and response.is_success:
+            self._cache.set(cache_key, content, ttl)
+        return response, content
 
-        return response, data
-
-    def _get_data(
+    def _get_bytes(
         self, endpoint: str, query: BaseModel | Mapping[str, Any] | None, operation: str
-    ) -> Any:
-        response, data = self._request(endpoint, query)
+    ) -> bytes:
+        return self._get_data_with_params(endpoint, _normalize_params(query), operation)
+
+    def _get_data_with_params(
+        self, endpoint: str, query_string: str, operation: str
+    ) -> bytes:
+        """Like ``_get_bytes`` for a query already encoded by ``_normalize_params``."""
+        response, content = self._request(endpoint, query_string)
         if not response.is_success:
             raise DataRequestError(
                 f"[DataSDK] {operation} failed: status {response.status_code}",
                 status_code=response.status_code,
-                error_data=data,
+                error_data=_error_data(response),
             )
-        if data is None:
+        if content is None:
             raise DataRequestError(
                 f"[DataSDK] {operation} returned null data despite successful response",
                 status_code=response.status_code,
             )
-        return data
+        return content
+
+    def _iter_items(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        adapter: TypeAdapter[_T],
+    ) -> Iterator[_T]:
+        """Stream a JSON array response, validating one element at a time.
+
+        Never cached or retried; see the ``iter_*`` docstrings.
+        """
+        with self._client.stream(
+            "GET", _with_query(endpoint, _normalize_params(query))
+        ) as response:
+            if not response.is_success:
+                response.read()
+                raise DataRequestError(
+                    f"[DataSDK] {operation} failed: status {response.status_code}",
+                    status_code=response.status_code,
+                    error_data=_error_data(response),
+                )
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield adapter.validate_python(item)
+                del items[:]
+            parser.close()
+            for item in items:
+                yield adapter.validate_python(item)
 
     # Health Check API
     def health_check(self) -> DataHealthResponse:
@@ -185,8 +438,10 @@ class DataClient:
             print(health.data)  # "OK"
             ```
         """
-        data = self._get_data("/", None, "Health check")
-        return DataHealthResponse.model_validate(data)
+        content = self._get_bytes("/", None, "Health check")
+        if self._trust_server:
+            return DataHealthResponse.model_construct(**orjson.loads(content))
+        return DataHealthResponse.model_validate_json(content)
 
     # Positions API
     def get_current_positions(
@@ -212,8 +467,8 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/positions", query, "Get current positions")
-        return TypeAdapter(list[Position]).validate_python(data)
+        content = self._get_bytes("/positions", query, "Get current positions")
+        return _POSITION_LIST_ADAPTER.validate_json(content)
 
     def get_closed_positions(
         self, query: ClosedPositionsQuery | Mapping[str, Any]
@@ -238,8 +493,8 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/closed-positions", query, "Get closed positions")
-        return TypeAdapter(list[ClosedPosition]).validate_python(data)
+        content = self._get_bytes("/closed-positions", query, "Get closed positions")
+        return _CLOSED_POSITION_LIST_ADAPTER.validate_json(content)
 
     # Trades API
     def get_trades(
@@ -266,8 +521,35 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/trades", query, "Get trades")
-        return TypeAdapter(list[DataTrade]).validate_python(data)
+        content = self._get_bytes("/trades", query, "Get trades")
+        return _TRADE_LIST_ADAPTER.validate_json(content)
+
+    def iter_trades(
+        self, query: TradesQuery | Mapping[str, Any] | None = None
+    ) -> Iterator[DataTrade]:
+        """
+        Stream trades for a user or markets
+
+        Parses the response incrementally, so large pages are never held in
+        memory as a whole. The stream bypasses the response cache and is not
+        retried: an error status or a connection dropped mid-stream raises.
+
+        Args:
+            query: Optional query parameters for filtering and pagination
+
+        Returns:
+            Iterator[DataTrade]: Trades in response order
+
+        Raises:
+            DataRequestError: When API request fails
+
+        Example:
+            ```python
+            for trade in data.iter_trades({"user": "0x123...", "limit": 500}):
+                print(trade.price)
+            ```
+        """
+        return self._iter_items("/trades", query, "Get trades", _TRADE_ADAPTER)
 
     # User Activity API
     def get_user_activity(
@@ -294,10 +576,40 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/activity", query, "Get user activity")
-        return TypeAdapter(list[Activity]).validate_python(data)
+        content = self._get_bytes("/activity", query, "Get user activity")
+        return _ACTIVITY_LIST_ADAPTER.validate_json(content)
+
+    def iter_user_activity(
+        self, query: UserActivityQuery | Mapping[str, Any]
+    ) -> Iterator[Activity]:
+        """
+        Stream user activity
+
+        Parses the response incrementally, so large pages are never held in
+        memory as a whole. The stream bypasses the response cache and is not
+        retried: an error status or a connection dropped mid-stream raises.
+
+        Args:
+            query: Query parameters including required user address
+
+        Returns:
+            Iterator[Activity]: Activity records in response order
+
+        Raises:
+            DataRequestError: When API request fails
+
+        Example:
+            ```python
+            for activity in data.iter_user_activity({"user": "0x123..."}):
+                print(activity.type)
+            ```
+        """
+        return self._iter_items(
+            "/activity", query, "Get user activity", _ACTIVITY_ADAPTER
+        )
 
     # Holders API
+    @cacheable(ttl=30)
     def get_top_holders(
         self, query: TopHoldersQuery | Mapping[str, Any]
     ) -> list[MetaHolder]:
@@ -322,8 +634,8 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/holders", query, "Get top holders")
-        return TypeAdapter(list[MetaHolder]).validate_python(data)
+        content = self._get_bytes("/holders", query, "Get top holders")
+        return _META_HOLDER_LIST_ADAPTER.validate_json(content)
 
     # Value API
     def get_total_value(
@@ -349,8 +661,8 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/value", query, "Get total value")
-        return TypeAdapter(list[TotalValue]).validate_python(data)
+        content = self._get_bytes("/value", query, "Get total value")
+        return _TOTAL_VALUE_LIST_ADAPTER.validate_json(content)
 
     # Markets Traded API
     def get_total_markets_traded(
@@ -376,10 +688,11 @@ class DataClient:
             print(total_markets.traded)  # number of markets traded
             ```
         """
-        data = self._get_data("/traded", query, "Get total markets traded")
-        return TotalMarketsTraded.model_validate(data)
+        content = self._get_bytes("/traded", query, "Get total markets traded")
+        return _parse_markets_traded(content, self._trust_server)
 
     # Open Interest API
+    @cacheable(ttl=30)
     def get_open_interest(
         self, query: OpenInterestQuery | Mapping[str, Any]
     ) -> list[OpenInterest]:
@@ -402,10 +715,11 @@ class DataClient:
             })
             ```
         """
-        data = self._get_data("/oi", query, "Get open interest")
-        return TypeAdapter(list[OpenInterest]).validate_python(data)
+        content = self._get_bytes("/oi", query, "Get open interest")
+        return _OPEN_INTEREST_LIST_ADAPTER.validate_json(content)
 
     # Live Volume API
+    @cacheable(ttl=30)
     def get_live_volume(
         self, query: LiveVolumeQuery | Mapping[str, Any]
     ) -> LiveVolumeResponse:
@@ -430,8 +744,10 @@ class DataClient:
             print(live_volume.markets)  # array of market volumes
             ```
         """
-        data = self._get_data("/live-volume", query, "Get live volume")
-        return LiveVolumeResponse.model_validate(data)
+        content = self._get_bytes("/live-volume", query, "Get live volume")
+        if self._trust_server:
+            return _construct_live_volume(orjson.loads(content))
+        return LiveVolumeResponse.model_validate_json(content)
 
     # Convenience methods for common use cases
 
@@ -461,10 +777,24 @@ class DataClient:
         if options:
             query_base.update(options)
 
-        current, closed = (
-            self.get_current_positions(query_base),
-            self.get_closed_positions(query_base),
-        )
+        # Both endpoints take the same query: encode it once. The two lookups are
+        # independent, so overlap their round trips.
+        params = _normalize_params(query_base)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            current_future = pool.submit(
+                self._get_data_with_params,
+                "/positions",
+                params,
+                "Get current positions",
+            )
+            closed_future = pool.submit(
+                self._get_data_with_params,
+                "/closed-positions",
+                params,
+                "Get closed positions",
+            )
+            current = _POSITION_LIST_ADAPTER.validate_json(current_future.result())
+            closed = _CLOSED_POSITION_LIST_ADAPTER.validate_json(closed_future.result())
 
         return {"current": current, "closed": closed}
 
@@ -485,11 +815,34 @@ class DataClient:
             print(portfolio["marketsTraded"])
             ```
         """
-        total_value, markets_traded, current_positions = (
-            self.get_total_value(TotalValueQuery(user=user)),
-            self.get_total_markets_traded(TotalMarketsTradedQuery(user=user)),
-            self.get_current_positions(PositionsQuery(user=user)),
-        )
+        # All three endpoints take just ``user``: encode it once. The lookups are
+        # independent, so overlap their round trips.
+        params = _normalize_params(TotalValueQuery(user=user))
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            total_value_future = pool.submit(
+                self._get_data_with_params, "/value", params, "Get total value"
+            )
+            markets_traded_future = pool.submit(
+                self._get_data_with_params,
+                "/traded",
+                params,
+                "Get total markets traded",
+            )
+            positions_future = pool.submit(
+                self._get_data_with_params,
+                "/positions",
+                params,
+                "Get current positions",
+            )
+            total_value = _TOTAL_VALUE_LIST_ADAPTER.validate_json(
+                total_value_future.result()
+            )
+            markets_traded = _parse_markets_traded(
+                markets_traded_future.result(), self._trust_server
+            )
+            current_positions = _POSITION_LIST_ADAPTER.validate_json(
+                positions_future.result()
+            )
 
         return {
             "totalValue": total_value,
@@ -1,35 +1,32 @@
 from __future__ import annotations
 
-from typing import Literal
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, ClassVar, Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# One ProxyConfig serves both APIs; re-exported here so the Data import path
+# keeps working
+from ..gamma.models import ProxyConfig as ProxyConfig  # noqa: PLC0414
+from ..gamma.models import _compile_to_params
 
 
 class DataModel(BaseModel):
     model_config = ConfigDict(extra="allow", populate_by_name=True)
 
 
-class ProxyConfig(DataModel):
-    host: str
-    port: int
-    username: str | None = None
-    password: str | None = None
-    protocol: str | None = None
-
-    def to_url(self) -> str:
-        protocol = self.protocol or "http"
-        if self.username and self.password:
-            return (
-                f"{protocol}://{self.username}:{self.password}@{self.host}:{self.port}"
-            )
-        return f"{protocol}://{self.host}:{self.port}"
+class _StrictDataModel(DataModel):
+    # Response DTOs enumerate every field we use; dropping unknown keys avoids
+    # carrying a __pydantic_extra__ dict on each of thousands of list items.
+    model_config = ConfigDict(extra="ignore", populate_by_name=False)
 
 
-class DataHealthResponse(DataModel):
+class DataHealthResponse(_StrictDataModel):
     data: str
 
 
-class Position(DataModel):
+class Position(_StrictDataModel):
     proxyWallet: str
     asset: str
     conditionId: str
@@ -58,25 +55,25 @@ class Position(DataModel):
     negativeRisk: bool | None = None
 
 
-class ClosedPosition(DataModel):
+class ClosedPosition(_StrictDataModel):
     proxyWallet: str
     conditionId: str
     outcome: str
-    realizedPnl: str | float
-    avgPrice: str | float  # API can return as string or float
-    timestamp: str | int  # API can return as string or int
+    realizedPnl: float
+    avgPrice: float  # API can return as string or float
+    timestamp: int  # API can return as string or int
     # Optional fields that may be present in some responses
-    size: str | float | None = None
+    size: float | None = None
     assetId: str | None = None
     asset: str | None = None
     market: str | None = None
     side: Literal["BUY", "SELL"] | None = None
-    cost: str | None = None
-    value: str | None = None
-    fees: str | None = None
-    price: str | None = None
+    cost: float | None = None
+    value: float | None = None
+    fees: float | None = None
+    price: float | None = None
     closedAt: str | None = None
-    closedPrice: str | float | None = None
+    closedPrice: float | None = None
     lastUpdate: str | None = None
     # Additional fields that may be present (similar to Position)
     title: str | None = None
@@ -89,8 +86,33 @@ class ClosedPosition(DataModel):
     oppositeAsset: str | None = None
     negativeRisk: bool | None = None
 
-
-class DataTrade(DataModel):
+    # Numeric strings are parsed once here (pydantic's lax mode handles
+    # "1.5" -> 1.5); these validators cover the shapes it does not.
+    @field_validator(
+        "size", "cost", "value", "fees", "price", "closedPrice", mode="before"
+    )
+    @classmethod
+    def _blank_to_none(cls, value: Any) -> Any:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def _parse_timestamp(cls, value: Any) -> Any:
+        if isinstance(value, str) and not value.strip().lstrip("-").isdigit():
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+            if parsed.tzinfo is None:
+                # Read offset-less stamps as UTC, not the host's local time
+                parsed = parsed.replace(tzinfo=UTC)
+            return int(parsed.timestamp())
+        return value
+
+
+class DataTrade(_StrictDataModel):
     proxyWallet: str
     side: Literal["BUY", "SELL"]
     asset: str
@@ -117,7 +139,7 @@ ActivityType = Literal[
 ]
 
 
-class Activity(DataModel):
+class Activity(_StrictDataModel):
     proxyWallet: str
     timestamp: int
     conditionId: str
@@ -141,7 +163,7 @@ class Activity(DataModel):
     profileImageOptimized: str
 
 
-class Holder(DataModel):
+class Holder(_StrictDataModel):
     proxyWallet: str
     bio: str | None = None
     asset: str | None = None
@@ -155,38 +177,58 @@ class Holder(DataModel):
     verified: bool | None = None
 
 
-class MetaHolder(DataModel):
+class MetaHolder(_StrictDataModel):
     token: str
     holders: list[Holder]
 
 
-class TotalValue(DataModel):
+class TotalValue(_StrictDataModel):
     user: str
     value: float
 
 
-class TotalMarketsTraded(DataModel):
+class TotalMarketsTraded(_StrictDataModel):
     user: str
     traded: int
 
 
-class OpenInterest(DataModel):
+class OpenInterest(_StrictDataModel):
     market: str
-    value: str | float
+    value: float
 
 
-class LiveVolumeMarket(DataModel):
+class LiveVolumeMarket(_StrictDataModel):
     market: str
     value: float
 
 
-class LiveVolumeResponse(DataModel):
+class LiveVolumeResponse(_StrictDataModel):
     total: float
     markets: list[LiveVolumeMarket]
 
 
 # Query parameter models
-class PositionsQuery(DataModel):
+class FastDumpQuery(DataModel):
+    """Base class for Data API query models.
+
+    Each subclass gets a ``__to_params__`` serializer generated from its
+    fields, which the clients use to build the request query string.
+    """
+
+    # Returns the non-None fields as request params; generated from each
+    # class's fields by the same helper as the Gamma query models
+    __to_params__: ClassVar[Callable[[Any], dict[str, Any]]]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__to_params__ = _compile_to_params(cls)
+
+
+FastDumpQuery.__to_params__ = _compile_to_params(FastDumpQuery)
+
+
+class PositionsQuery(FastDumpQuery):
     user: str
     market: list[str] | None = None
     eventId: list[str] | None = None
@@ -200,7 +242,7 @@ class PositionsQuery(DataModel):
     title: str | None = None
 
 
-class ClosedPositionsQuery(DataModel):
+class ClosedPositionsQuery(FastDumpQuery):
     user: str
     market: list[str] | None = None
     eventId: list[str] | None = None
@@ -211,7 +253,7 @@ class ClosedPositionsQuery(DataModel):
     sortDirection: Literal["ASC", "DESC"] | None = None
 
 
-class TradesQuery(DataModel):
+class TradesQuery(FastDumpQuery):
     limit: int | None = None
     offset: int | None = None
     takerOnly: bool | None = None
@@ -223,7 +265,7 @@ class TradesQuery(DataModel):
     side: Literal["BUY", "SELL"] | None = None
 
 
-class UserActivityQuery(DataModel):
+class UserActivityQuery(FastDumpQuery):
     user: str
     limit: int | None = None
     offset: int | None = None
@@ -239,24 +281,24 @@ class UserActivityQuery(DataModel):
     side: Literal["BUY", "SELL"] | None = None
 
 
-class TopHoldersQuery(DataModel):
+class TopHoldersQuery(FastDumpQuery):
     limit: int | None = None
     market: list[str]
     minBalance: float | None = None
 
 
-class TotalValueQuery(DataModel):
+class TotalValueQuery(FastDumpQuery):
     user: str
     market: list[str] | None = None
 
 
-class TotalMarketsTradedQuery(DataModel):
+class TotalMarketsTradedQuery(FastDumpQuery):
     user: str
 
 
-class OpenInterestQuery(DataModel):
+class OpenInterestQuery(FastDumpQuery):
     market: list[str]
 
 
-class LiveVolumeQuery(DataModel):
+class LiveVolumeQuery(FastDumpQuery):
     id: int
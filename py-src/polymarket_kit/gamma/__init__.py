@@ -1,5 +1,14 @@
-from .client import GammaClient, GammaRequestError, GammaSDK
+from .async_client import AsyncGammaClient, AsyncGammaSDK
+from .client import (
+    GammaClient,
+    GammaRequestError,
+    GammaSDK,
+    default_client,
+    get_default_client,
+)
 from .models import (
+    EVENT_LIST,
+    MARKET_LIST,
     Comment,
     CommentByIdQuery,
     CommentQuery,
@@ -15,8 +24,11 @@ from .models import (
     ProxyConfig,
     RelatedTagRelationship,
     RelatedTagsQuery,
+    SearchEvent,
+    SearchProfile,
     SearchQuery,
     SearchResponse,
+    SearchTag,
     Series,
     SeriesByIdQuery,
     SeriesEvent,
@@ -32,6 +44,10 @@ from .models import (
 )
 
 __all__ = [
+    "EVENT_LIST",
+    "MARKET_LIST",
+    "AsyncGammaClient",
+    "AsyncGammaSDK",
     "Comment",
     "CommentByIdQuery",
     "CommentQuery",
@@ -50,8 +66,11 @@ __all__ = [
     "ProxyConfig",
     "RelatedTagRelationship",
     "RelatedTagsQuery",
+    "SearchEvent",
+    "SearchProfile",
     "SearchQuery",
     "SearchResponse",
+    "SearchTag",
     "Series",
     "SeriesByIdQuery",
     "SeriesEvent",
@@ -64,4 +83,6 @@ __all__ = [
     "UpdatedEventQuery",
     "UpdatedMarketQuery",
     "UpdatedTag",
+    "default_client",
+    "get_default_client",
 ]
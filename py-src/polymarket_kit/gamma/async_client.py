@@ -0,0 +1,587 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Collection, Mapping, Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+
+import httpx
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from .client import (
+    _ADAPTER_MODELS,
+    _COMMENTS_ADAPTER,
+    _EVENTS_ADAPTER,
+    _MARKETS_ADAPTER,
+    _RELATED_TAGS_ADAPTER,
+    _SERIES_ADAPTER,
+    _TAGS_ADAPTER,
+    _TEAMS_ADAPTER,
+    _URL_COMMENT_BY_ID,
+    _URL_COMMENTS,
+    _URL_COMMENTS_BY_USER,
+    _URL_EVENT_BY_ID,
+    _URL_EVENT_BY_SLUG,
+    _URL_EVENT_TAGS,
+    _URL_EVENTS,
+    _URL_EVENTS_PAGINATION,
+    _URL_HEALTH,
+    _URL_MARKET_BY_ID,
+    _URL_MARKET_BY_SLUG,
+    _URL_MARKET_TAGS,
+    _URL_MARKETS,
+    _URL_PUBLIC_SEARCH,
+    _URL_RELATED_TAGS_BY_ID,
+    _URL_RELATED_TAGS_BY_SLUG,
+    _URL_SERIES,
+    _URL_SERIES_BY_ID,
+    _URL_TAG_BY_ID,
+    _URL_TAG_BY_SLUG,
+    _URL_TAGS,
+    _URL_TAGS_RELATED_TO_ID,
+    _URL_TAGS_RELATED_TO_SLUG,
+    _URL_TEAMS,
+    DEFAULT_BACKOFF_BASE,
+    DEFAULT_BASE_URL,
+    DEFAULT_LOOKUP_CACHE_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_RETRY_DELAY,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRY_ON,
+    DEFAULT_TIMEOUT,
+    HEALTH_CACHE_TTL,
+    GammaRequestError,
+    _error_data,
+    _instance_lru,
+    _ModelT,
+    _normalize_params,
+    _ResponseCache,
+    _retry_delay,
+    _with_flag,
+)
+from .models import (
+    Comment,
+    CommentByIdQuery,
+    CommentQuery,
+    CommentsByUserQuery,
+    Event,
+    EventByIdQuery,
+    Market,
+    MarketByIdQuery,
+    PaginatedEventQuery,
+    PaginatedEventsResponse,
+    ProxyConfig,
+    RelatedTagRelationship,
+    RelatedTagsQuery,
+    SearchQuery,
+    SearchResponse,
+    Series,
+    SeriesByIdQuery,
+    SeriesQuery,
+    TagByIdQuery,
+    TagQuery,
+    Team,
+    TeamQuery,
+    UpdatedEventQuery,
+    UpdatedMarketQuery,
+    UpdatedTag,
+)
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+
+class AsyncGammaClient:
+    def __init__(
+        self,
+        *,
+        proxy: ProxyConfig | str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        headers: Mapping[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        cache_ttl: float = 0.0,
+        cache_dir: str | Path | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        lookup_cache_size: int = DEFAULT_LOOKUP_CACHE_SIZE,
+        retry_on: Collection[int] = DEFAULT_RETRY_ON,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        trust_server: bool = False,
+    ) -> None:
+        self._trust_server = trust_server
+        self._cache = _ResponseCache(cache_ttl, cache_dir)
+        self._slug_cache: OrderedDict[tuple[str, Any, str], Any] = OrderedDict()
+        self._slug_cache_size = lookup_cache_size
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        self._health_ttl = HEALTH_CACHE_TTL
+        self._retry_on = frozenset(retry_on)
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._max_retry_delay = max_retry_delay
+        self._inflight: dict[str, asyncio.Task[httpx.Response]] = {}
+
+        if client is not None:
+            self._client = client
+            self._owns_client = False
+            return
+
+        proxy_url: str | None = None
+        if isinstance(proxy, ProxyConfig):
+            proxy_url = proxy.url
+        elif isinstance(proxy, str):
+            proxy_url = proxy
+
+        default_headers = {
+            "User-Agent": "polymarket-kit/0.1.0",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+        if headers:
+            default_headers.update(headers)
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            headers=default_headers,
+            proxy=proxy_url,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=pool_size,
+                max_connections=max(pool_size, 100),
+                keepalive_expiry=60.0,
+            ),
+        )
+        self._owns_client = True
+
+    async def __aenter__(self) -> AsyncGammaClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._client
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
+    def slug_cache_clear(self) -> None:
+        """Forget memoized tag/event/market lookups by ID or slug."""
+        self._slug_cache.clear()
+
+    async def _request(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        *,
+        no_cache: bool = False,
+    ) -> tuple[httpx.Response, bytes | None]:
+        params = _normalize_params(query) if query is not None else None
+        key = self._cache.key(endpoint, params or {})
+        use_cache = self._cache.enabled and not no_cache
+        if use_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return httpx.Response(200, content=cached), cached
+
+        # Concurrent callers asking for the same URL share one upstream GET
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        response = await asyncio.shield(task)
+        if response.status_code == 204 or not response.content:
+            return response, None
+
+        content = response.content
+        if use_cache and response.is_success:
+            self._cache.set(key, content)
+
+        return response, content
+
+    async def _send(
+        self, endpoint: str, params: dict[str, Any] | None
+    ) -> httpx.Response:
+        """GET with exponential backoff on connect errors and retryable statuses."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.get(endpoint, params=params)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt >= self._max_retries:
+                    raise
+                await asyncio.sleep(
+                    _retry_delay(
+                        None, attempt, self._backoff_base, self._max_retry_delay
+                    )
+                )
+            else:
+                if (
+                    response.status_code not in self._retry_on
+                    or attempt >= self._max_retries
+                ):
+                    return response
+                await response.aclose()
+                await asyncio.sleep(
+                    _retry_delay(
+                        response, attempt, self._backoff_base, self._max_retry_delay
+                    )
+                )
+            attempt += 1
+
+    async def _get_json_bytes(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        *,
+        no_cache: bool = False,
+    ) -> bytes:
+        response, content = await self._request(endpoint, query, no_cache=no_cache)
+        if not response.is_success:
+            raise GammaRequestError(
+                f"[AsyncGammaClient] {operation} failed: status {response.status_code}",
+                status_code=response.status_code,
+                error_data=_error_data(response),
+            )
+        if content is None:
+            raise GammaRequestError(
+                f"[AsyncGammaClient] {operation} returned no data",
+                status_code=response.status_code,
+            )
+        return content
+
+    async def _get_optional_json_bytes(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        *,
+        no_cache: bool = False,
+    ) -> bytes | None:
+        response, content = await self._request(endpoint, query, no_cache=no_cache)
+        if response.status_code == 404:
+            return None
+        if not response.is_success:
+            raise GammaRequestError(
+                f"[AsyncGammaClient] {operation} failed: status {response.status_code}",
+                status_code=response.status_code,
+                error_data=_error_data(response),
+            )
+        return content
+
+    async def _get_data(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        *,
+        no_cache: bool = False,
+    ) -> Any:
+        return orjson.loads(
+            await self._get_json_bytes(endpoint, query, operation, no_cache=no_cache)
+        )
+
+    async def _get_list(
+        self,
+        adapter: TypeAdapter[list[_ModelT]],
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+    ) -> list[_ModelT]:
+        content = await self._get_json_bytes(endpoint, query, operation)
+        if self._trust_server:
+            model = _ADAPTER_MODELS[adapter]
+            return [model.from_trusted(item) for item in orjson.loads(content)]
+        return adapter.validate_json(content)
+
+    async def _get_model(
+        self,
+        model: type[_ModelT],
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+    ) -> _ModelT:
+        content = await self._get_json_bytes(endpoint, query, operation)
+        if self._trust_server:
+            return model.from_trusted_json(content)
+        return model.model_validate_json(content)
+
+    async def _get_optional_model(
+        self,
+        model: type[_ModelT],
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+    ) -> _ModelT | None:
+        content = await self._get_optional_json_bytes(endpoint, query, operation)
+        if content is None:
+            return None
+        if self._trust_server:
+            return model.from_trusted_json(content)
+        return model.model_validate_json(content)
+
+    async def get_health(self, *, force: bool = False) -> dict[str, Any]:
+        """Return ``/health``, reusing a result younger than a few seconds.
+
+        Pass ``force=True`` to always hit the network.
+        """
+        cached = self._health_cache
+        if (
+            not force
+            and cached is not None
+            and time.monotonic() - cached[0] < self._health_ttl
+        ):
+            return dict(cached[1])
+        data = dict(await self._get_data(_URL_HEALTH, None, "Get health"))
+        self._health_cache = (time.monotonic(), data)
+        return dict(data)
+
+    async def get_teams(
+        self, query: TeamQuery | Mapping[str, Any] | None = None
+    ) -> list[Team]:
+        return await self._get_list(_TEAMS_ADAPTER, _URL_TEAMS, query, "Get teams")
+
+    async def get_tags(
+        self, query: TagQuery | Mapping[str, Any] | None = None
+    ) -> list[UpdatedTag]:
+        return await self._get_list(_TAGS_ADAPTER, _URL_TAGS, query, "Get tags")
+
+    @_instance_lru
+    async def get_tag_by_id(
+        self, tag_id: int, query: TagByIdQuery | Mapping[str, Any] | None = None
+    ) -> UpdatedTag | None:
+        return await self._get_optional_model(
+            UpdatedTag, _URL_TAG_BY_ID(tag_id), query, "Get tag by ID"
+        )
+
+    @_instance_lru
+    async def get_tag_by_slug(
+        self, slug: str, query: TagByIdQuery | Mapping[str, Any] | None = None
+    ) -> UpdatedTag | None:
+        return await self._get_optional_model(
+            UpdatedTag, _URL_TAG_BY_SLUG(slug), query, "Get tag by slug"
+        )
+
+    async def get_related_tags_relationships_by_tag_id(
+        self, tag_id: int, query: RelatedTagsQuery | Mapping[str, Any] | None = None
+    ) -> list[RelatedTagRelationship]:
+        return await self._get_list(
+            _RELATED_TAGS_ADAPTER,
+            _URL_RELATED_TAGS_BY_ID(tag_id),
+            query,
+            "Get related tags relationships",
+        )
+
+    async def get_related_tags_relationships_by_tag_slug(
+        self, slug: str, query: RelatedTagsQuery | Mapping[str, Any] | None = None
+    ) -> list[RelatedTagRelationship]:
+        return await self._get_list(
+            _RELATED_TAGS_ADAPTER,
+            _URL_RELATED_TAGS_BY_SLUG(slug),
+            query,
+            "Get related tags relationships",
+        )
+
+    async def get_tags_related_to_tag_id(
+        self, tag_id: int, query: RelatedTagsQuery | Mapping[str, Any] | None = None
+    ) -> list[UpdatedTag]:
+        return await self._get_list(
+            _TAGS_ADAPTER,
+            _URL_TAGS_RELATED_TO_ID(tag_id),
+            query,
+            "Get related tags",
+        )
+
+    async def get_tags_related_to_tag_slug(
+        self, slug: str, query: RelatedTagsQuery | Mapping[str, Any] | None = None
+    ) -> list[UpdatedTag]:
+        return await self._get_list(
+            _TAGS_ADAPTER,
+            _URL_TAGS_RELATED_TO_SLUG(slug),
+            query,
+            "Get related tags",
+        )
+
+    async def get_events(
+        self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
+    ) -> list[Event]:
+        return await self._get_list(_EVENTS_ADAPTER, _URL_EVENTS, query, "Get events")
+
+    async def get_events_paginated(
+        self, query: PaginatedEventQuery | Mapping[str, Any]
+    ) -> PaginatedEventsResponse:
+        return await self._get_model(
+            PaginatedEventsResponse,
+            _URL_EVENTS_PAGINATION,
+            query,
+            "Get paginated events",
+        )
+
+    @_instance_lru
+    async def get_event_by_id(
+        self, event_id: int, query: EventByIdQuery | Mapping[str, Any] | None = None
+    ) -> Event | None:
+        return await self._get_optional_model(
+            Event, _URL_EVENT_BY_ID(event_id), query, "Get event by ID"
+        )
+
+    async def get_event_tags(self, event_id: int) -> list[UpdatedTag]:
+        return await self._get_list(
+            _TAGS_ADAPTER, _URL_EVENT_TAGS(event_id), None, "Get event tags"
+        )
+
+    @_instance_lru
+    async def get_event_by_slug(
+        self, slug: str, query: EventByIdQuery | Mapping[str, Any] | None = None
+    ) -> Event | None:
+        return await self._get_optional_model(
+            Event, _URL_EVENT_BY_SLUG(slug), query, "Get event by slug"
+        )
+
+    async def get_markets(
+        self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
+    ) -> list[Market]:
+        return await self._get_list(
+            _MARKETS_ADAPTER, _URL_MARKETS, query, "Get markets"
+        )
+
+    @_instance_lru
+    async def get_market_by_id(
+        self, market_id: int, query: MarketByIdQuery | Mapping[str, Any] | None = None
+    ) -> Market | None:
+        return await self._get_optional_model(
+            Market, _URL_MARKET_BY_ID(market_id), query, "Get market by ID"
+        )
+
+    async def get_market_tags(self, market_id: int) -> list[UpdatedTag]:
+        return await self._get_list(
+            _TAGS_ADAPTER, _URL_MARKET_TAGS(market_id), None, "Get market tags"
+        )
+
+    @_instance_lru
+    async def get_market_by_slug(
+        self, slug: str, query: MarketByIdQuery | Mapping[str, Any] | None = None
+    ) -> Market | None:
+        return await self._get_optional_model(
+            Market, _URL_MARKET_BY_SLUG(slug), query, "Get market by slug"
+        )
+
+    async def get_series(self, query: SeriesQuery | Mapping[str, Any]) -> list[Series]:
+        return await self._get_list(_SERIES_ADAPTER, _URL_SERIES, query, "Get series")
+
+    async def get_series_by_id(
+        self, series_id: int, query: SeriesByIdQuery | Mapping[str, Any] | None = None
+    ) -> Series | None:
+        return await self._get_optional_model(
+            Series, _URL_SERIES_BY_ID(series_id), query, "Get series by ID"
+        )
+
+    async def get_comments(
+        self, query: CommentQuery | Mapping[str, Any] | None = None
+    ) -> list[Comment]:
+        return await self._get_list(
+            _COMMENTS_ADAPTER, _URL_COMMENTS, query, "Get comments"
+        )
+
+    async def get_comments_by_comment_id(
+        self, comment_id: int, query: CommentByIdQuery | Mapping[str, Any] | None = None
+    ) -> list[Comment]:
+        return await self._get_list(
+            _COMMENTS_ADAPTER,
+            _URL_COMMENT_BY_ID(comment_id),
+            query,
+            "Get comments by comment ID",
+        )
+
+    async def get_comments_by_user_address(
+        self,
+        user_address: str,
+        query: CommentsByUserQuery | Mapping[str, Any] | None = None,
+    ) -> list[Comment]:
+        return await self._get_list(
+            _COMMENTS_ADAPTER,
+            _URL_COMMENTS_BY_USER(user_address),
+            query,
+            "Get comments by user address",
+        )
+
+    async def search(self, query: SearchQuery | Mapping[str, Any]) -> SearchResponse:
+        return await self._get_model(
+            SearchResponse, _URL_PUBLIC_SEARCH, query, "Search"
+        )
+
+    async def get_active_events(
+        self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
+    ) -> list[Event]:
+        return await self.get_events(_with_flag(query, active=True))
+
+    async def get_closed_events(
+        self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
+    ) -> list[Event]:
+        return await self.get_events(_with_flag(query, closed=True))
+
+    async def get_featured_events(
+        self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
+    ) -> list[Event]:
+        return await self.get_events(_with_flag(query, featured=True))
+
+    async def get_active_markets(
+        self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
+    ) -> list[Market]:
+        return await self.get_markets(_with_flag(query, active=True))
+
+    async def get_closed_markets(
+        self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
+    ) -> list[Market]:
+        return await self.get_markets(_with_flag(query, closed=True))
+
+    async def _gather_bounded(
+        self,
+        func: Callable[[_K], Awaitable[_T]],
+        keys: Sequence[_K],
+        concurrency: int,
+    ) -> list[_T]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(key: _K) -> _T:
+            async with semaphore:
+                return await func(key)
+
+        return await asyncio.gather(*(run(key) for key in keys))
+
+    async def get_events_by_ids(
+        self, event_ids: Sequence[int], *, concurrency: int = 10
+    ) -> list[Event | None]:
+        return await self._gather_bounded(self.get_event_by_id, event_ids, concurrency)
+
+    async def get_markets_by_ids(
+        self, market_ids: Sequence[int], *, concurrency: int = 10
+    ) -> list[Market | None]:
+        return await self._gather_bounded(
+            self.get_market_by_id, market_ids, concurrency
+        )
+
+    async def get_event_tags_batch(
+        self, event_ids: Sequence[int], *, concurrency: int = 10
+    ) -> list[list[UpdatedTag]]:
+        return await self._gather_bounded(self.get_event_tags, event_ids, concurrency)
+
+    async def get_tags_by_slugs(
+        self, slugs: Sequence[str], *, concurrency: int = 10
+    ) -> list[UpdatedTag | None]:
+        return await self._gather_bounded(self.get_tag_by_slug, slugs, concurrency)
+
+
+AsyncGammaSDK = AsyncGammaClient
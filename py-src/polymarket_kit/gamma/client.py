@@ -1,22 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+import atexit
+import functools
+import hashlib
+import inspect
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterator, Mapping
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, TypeVar
+from urllib.parse import urlencode
 
 import httpx
-from pydantic import BaseModel, TypeAdapter
+import ijson
+import orjson
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from .models import (
+    EVENT_LIST,
+    MARKET_LIST,
     Comment,
     CommentByIdQuery,
     CommentQuery,
     CommentsByUserQuery,
     Event,
     EventByIdQuery,
+    GammaModel,
     Market,
     MarketByIdQuery,
     PaginatedEventQuery,
     PaginatedEventsResponse,
     ProxyConfig,
+    QueryModel,
     RelatedTagRelationship,
     RelatedTagsQuery,
     SearchQuery,
@@ -31,10 +49,73 @@ from .models import (
     UpdatedEventQuery,
     UpdatedMarketQuery,
     UpdatedTag,
+    _compile_to_params,
+    _stringify_param,
 )
 
 DEFAULT_BASE_URL = "https://gamma-api.polymarket.com"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_POOL_SIZE = 32
+DEFAULT_LOOKUP_CACHE_SIZE = 1024
+HEALTH_CACHE_TTL = 5.0
+DEFAULT_RETRY_ON: tuple[int, ...] = (429, 500, 502, 503, 504)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.25
+DEFAULT_MAX_RETRY_DELAY = 30.0
+
+_ModelT = TypeVar("_ModelT", bound=GammaModel)
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Endpoint paths; parameterized ones are bound str.format methods.
+_URL_HEALTH = "/health"
+_URL_TEAMS = "/teams"
+_URL_TAGS = "/tags"
+_URL_EVENTS = "/events"
+_URL_EVENTS_PAGINATION = "/events/pagination"
+_URL_MARKETS = "/markets"
+_URL_SERIES = "/series"
+_URL_COMMENTS = "/comments"
+_URL_PUBLIC_SEARCH = "/public-search"
+_URL_TAG_BY_ID = "/tags/{}".format
+_URL_TAG_BY_SLUG = "/tags/slug/{}".format
+_URL_RELATED_TAGS_BY_ID = "/tags/{}/related-tags".format
+_URL_RELATED_TAGS_BY_SLUG = "/tags/slug/{}/related-tags".format
+_URL_TAGS_RELATED_TO_ID = "/tags/{}/related-tags/tags".format
+_URL_TAGS_RELATED_TO_SLUG = "/tags/slug/{}/related-tags/tags".format
+_URL_EVENT_BY_ID = "/events/{}".format
+_URL_EVENT_TAGS = "/events/{}/tags".format
+_URL_EVENT_BY_SLUG = "/events/slug/{}".format
+_URL_MARKET_BY_ID = "/markets/{}".format
+_URL_MARKET_TAGS = "/markets/{}/tags".format
+_URL_MARKET_BY_SLUG = "/markets/slug/{}".format
+_URL_SERIES_BY_ID = "/series/{}".format
+_URL_COMMENT_BY_ID = "/comments/{}".format
+_URL_COMMENTS_BY_USER = "/comments/user_address/{}".format
+
+# Built on first use, like the models themselves
+_DEFERRED = ConfigDict(defer_build=True)
+
+_TEAMS_ADAPTER = TypeAdapter(list[Team], config=_DEFERRED)
+_TAGS_ADAPTER = TypeAdapter(list[UpdatedTag], config=_DEFERRED)
+_EVENTS_ADAPTER = EVENT_LIST
+_MARKETS_ADAPTER = MARKET_LIST
+_SERIES_ADAPTER = TypeAdapter(list[Series], config=_DEFERRED)
+_COMMENTS_ADAPTER = TypeAdapter(list[Comment], config=_DEFERRED)
+_RELATED_TAGS_ADAPTER = TypeAdapter(list[RelatedTagRelationship], config=_DEFERRED)
+
+# Element model of each list adapter, for building trusted responses
+_ADAPTER_MODELS: dict[TypeAdapter[Any], type[GammaModel]] = {
+    _TEAMS_ADAPTER: Team,
+    _TAGS_ADAPTER: UpdatedTag,
+    _EVENTS_ADAPTER: Event,
+    _MARKETS_ADAPTER: Market,
+    _SERIES_ADAPTER: Series,
+    _COMMENTS_ADAPTER: Comment,
+    _RELATED_TAGS_ADAPTER: RelatedTagRelationship,
+}
+
+# Bump when the cached payload format changes so stale disk entries are ignored.
+CACHE_VERSION = 1
 
 
 class GammaRequestError(RuntimeError):
@@ -46,10 +127,12 @@ class GammaRequestError(RuntimeError):
         self.error_data = error_data
 
 
-def _stringify_param(value: Any) -> str:
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    return str(value)
+@functools.cache
+def _param_serializer(
+    model_cls: type[BaseModel],
+) -> Callable[[BaseModel], dict[str, Any]]:
+    """Generated serializer for query models that are not ``QueryModel``s."""
+    return _compile_to_params(model_cls)
 
 
 def _normalize_params(query: BaseModel | Mapping[str, Any] | None) -> dict[str, Any]:
@@ -57,9 +140,15 @@ def _normalize_params(query: BaseModel | Mapping[str, Any] | None) -> dict[str,
         return {}
 
     if isinstance(query, BaseModel):
-        data = query.model_dump(exclude_none=True)
-    else:
-        data = dict(query)
+        if isinstance(query, QueryModel):
+            params = query.__to_params__()
+        else:
+            params = _param_serializer(type(query))(query)
+        if query.__pydantic_extra__:
+            params.update(_normalize_params(query.__pydantic_extra__))
+        return params
+
+    data = dict(query)
 
     params: dict[str, Any] = {}
     for key, value in data.items():
@@ -75,6 +164,175 @@ def _normalize_params(query: BaseModel | Mapping[str, Any] | None) -> dict[str,
     return params
 
 
+def _with_flag(
+    query: BaseModel | Mapping[str, Any] | None, **flags: Any
+) -> BaseModel | Mapping[str, Any]:
+    if query is None:
+        return flags
+    if isinstance(query, BaseModel):
+        return query.model_copy(update=flags)
+    return {**query, **flags}
+
+
+def _error_data(response: httpx.Response) -> Any | None:
+    raw = response.content
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return raw.decode("utf-8", "replace")
+
+
+def _retry_delay(
+    response: httpx.Response | None,
+    attempt: int,
+    backoff_base: float,
+    max_delay: float = DEFAULT_MAX_RETRY_DELAY,
+) -> float:
+    """Seconds to wait before retry ``attempt``, honouring ``Retry-After``.
+
+    Capped at ``max_delay`` so a server asking for minutes (or an HTTP date
+    far in the future) cannot stall the caller indefinitely.
+    """
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), max_delay)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return min(max(0.0, retry_at.timestamp() - time.time()), max_delay)
+            except (TypeError, ValueError):
+                pass
+    return min(backoff_base * (2**attempt) + random.uniform(0, 0.1), max_delay)
+
+
+def _instance_lru(func: _F) -> _F:
+    """Memoize a ``(key, query)`` lookup on the instance's ``_slug_cache``.
+
+    Only found objects are stored, so a slug that 404s is retried next time.
+    Every call returns a deep copy of the cached model, so callers may mutate
+    what they get back without corrupting later lookups. Works for both sync
+    and async methods.
+    """
+    name = func.__name__
+
+    def cache_key(key: Any, query: Any) -> tuple[str, Any, str]:
+        params = _normalize_params(query)
+        return name, key, urlencode(sorted(params.items()), doseq=True)
+
+    # A shared client is used from several threads, so another thread may
+    # evict any key between two steps here; a vanished key is just a miss
+    def store(self: Any, cache_key: tuple[str, Any, str], value: Any) -> None:
+        cache: OrderedDict[tuple[str, Any, str], Any] = self._slug_cache
+        cache[cache_key] = value
+        if len(cache) > self._slug_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+
+    def lookup(self: Any, cache_key: tuple[str, Any, str]) -> Any:
+        cache: OrderedDict[tuple[str, Any, str], Any] = self._slug_cache
+        try:
+            cache.move_to_end(cache_key)
+            value = cache[cache_key]
+        except KeyError:
+            return None
+        return value.model_copy(deep=True)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: Any, key: Any, query: Any = None) -> Any:
+            if self._slug_cache_size <= 0:
+                return await func(self, key, query)
+            ck = cache_key(key, query)
+            cached = lookup(self, ck)
+            if cached is not None:
+                return cached
+            value = await func(self, key, query)
+            if value is not None:
+                store(self, ck, value)
+                return value.model_copy(deep=True)
+            return value
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(self: Any, key: Any, query: Any = None) -> Any:
+        if self._slug_cache_size <= 0:
+            return func(self, key, query)
+        ck = cache_key(key, query)
+        cached = lookup(self, ck)
+        if cached is not None:
+            return cached
+        value = func(self, key, query)
+        if value is not None:
+            store(self, ck, value)
+            return value.model_copy(deep=True)
+        return value
+
+    return wrapper  # type: ignore[return-value]
+
+
+class _ResponseCache:
+    """TTL cache of raw JSON response bodies, optionally mirrored to disk."""
+
+    def __init__(self, ttl: float, cache_dir: str | Path | None = None) -> None:
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries: dict[str, tuple[float, bytes]] = {}
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def key(endpoint: str, params: Mapping[str, Any]) -> str:
+        query = urlencode(sorted(params.items()), doseq=True)
+        raw = f"{CACHE_VERSION}:{endpoint}?{query}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            if time.monotonic() - stored_at < self.ttl:
+                return content
+            self._entries.pop(key, None)
+
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                age = time.time() - path.stat().st_mtime
+                if age < self.ttl:
+                    content = path.read_bytes()
+                    self._entries[key] = (time.monotonic() - age, content)
+                    return content
+            except OSError:
+                pass
+
+        return None
+
+    def set(self, key: str, content: bytes) -> None:
+        self._entries[key] = (time.monotonic(), content)
+        if self.cache_dir is not None:
+            try:
+                (self.cache_dir / f"{key}.json").write_bytes(content)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
 class GammaClient:
     def __init__(
         self,
@@ -84,7 +342,27 @@ class GammaClient:
         timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
         headers: Mapping[str, str] | None = None,
         client: httpx.Client | None = None,
+        cache_ttl: float = 0.0,
+        cache_dir: str | Path | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        lookup_cache_size: int = DEFAULT_LOOKUP_CACHE_SIZE,
+        retry_on: Collection[int] = DEFAULT_RETRY_ON,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        trust_server: bool = False,
     ) -> None:
+        self._trust_server = trust_server
+        self._cache = _ResponseCache(cache_ttl, cache_dir)
+        self._slug_cache: OrderedDict[tuple[str, Any, str], Any] = OrderedDict()
+        self._slug_cache_size = lookup_cache_size
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        self._health_ttl = HEALTH_CACHE_TTL
+        self._retry_on = frozenset(retry_on)
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._max_retry_delay = max_retry_delay
+
         if client is not None:
             self._client = client
             self._owns_client = False
@@ -92,13 +370,14 @@ class GammaClient:
 
         proxy_url: str | None = None
         if isinstance(proxy, ProxyConfig):
-            proxy_url = proxy.to_url()
+            proxy_url = proxy.url
         elif isinstance(proxy, str):
             proxy_url = proxy
 
         default_headers = {
             "User-Agent": "polymarket-kit/0.1.0",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
         }
         if headers:
             default_headers.update(headers)
@@ -108,10 +387,16 @@ class GammaClient:
             timeout=timeout,
             headers=default_headers,
             proxy=proxy_url,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=pool_size,
+                max_connections=max(pool_size, 100),
+                keepalive_expiry=60.0,
+            ),
         )
         self._owns_client = True
 
-    def __enter__(self) -> "GammaClient":
+    def __enter__(self) -> GammaClient:
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -125,279 +410,461 @@ class GammaClient:
         if self._owns_client:
             self._client.close()
 
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
+    def slug_cache_clear(self) -> None:
+        """Forget memoized tag/event/market lookups by ID or slug."""
+        self._slug_cache.clear()
+
     def _request(
-        self, endpoint: str, query: BaseModel | Mapping[str, Any] | None
-    ) -> tuple[httpx.Response, Any | None]:
-        response = self._client.get(endpoint, params=_normalize_params(query))
-        if response.status_code == 204:
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        *,
+        no_cache: bool = False,
+    ) -> tuple[httpx.Response, bytes | None]:
+        params = _normalize_params(query) if query is not None else None
+        cache_key: str | None = None
+        if self._cache.enabled and not no_cache:
+            cache_key = self._cache.key(endpoint, params or {})
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return httpx.Response(200, content=cached), cached
+
+        response = self._send(endpoint, params)
+        if response.status_code == 204 or not response.content:
             return response, None
 
-        data: Any | None = None
-        if response.content:
-            try:
-                data = response.json()
-            except ValueError:
-                data = response.text
+        content = response.content
+        if cache_key is not None and response.is_success:
+            self._cache.set(cache_key, content)
 
-        return response, data
+        return response, content
 
-    def _get_data(
-        self, endpoint: str, query: BaseModel | Mapping[str, Any] | None, operation: str
-    ) -> Any:
-        response, data = self._request(endpoint, query)
+    def _send(
+        self, endpoint: str, params: dict[str, Any] | None, *, stream: bool = False
+    ) -> httpx.Response:
+        """GET with exponential backoff on connect errors and retryable statuses.
+
+        With ``stream=True`` the body is left unread; the caller must close the
+        returned response.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self._client.send(
+                    self._client.build_request("GET", endpoint, params=params),
+                    stream=stream,
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt >= self._max_retries:
+                    raise
+                time.sleep(
+                    _retry_delay(
+                        None, attempt, self._backoff_base, self._max_retry_delay
+                    )
+                )
+            else:
+                if (
+                    response.status_code not in self._retry_on
+                    or attempt >= self._max_retries
+                ):
+                    return response
+                response.close()
+                time.sleep(
+                    _retry_delay(
+                        response, attempt, self._backoff_base, self._max_retry_delay
+                    )
+                )
+            attempt += 1
+
+    def _get_json_bytes(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        *,
+        no_cache: bool = False,
+    ) -> bytes:
+        response, content = self._request(endpoint, query, no_cache=no_cache)
         if not response.is_success:
             raise GammaRequestError(
                 f"[GammaClient] {operation} failed: status {response.status_code}",
                 status_code=response.status_code,
-                error_data=data,
+                error_data=_error_data(response),
             )
-        if data is None:
+        if content is None:
             raise GammaRequestError(
                 f"[GammaClient] {operation} returned no data",
                 status_code=response.status_code,
             )
-        return data
+        return content
 
-    def _get_optional_data(
-        self, endpoint: str, query: BaseModel | Mapping[str, Any] | None, operation: str
-    ) -> Any | None:
-        response, data = self._request(endpoint, query)
+    def _get_optional_json_bytes(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        *,
+        no_cache: bool = False,
+    ) -> bytes | None:
+        response, content = self._request(endpoint, query, no_cache=no_cache)
         if response.status_code == 404:
             return None
         if not response.is_success:
             raise GammaRequestError(
                 f"[GammaClient] {operation} failed: status {response.status_code}",
                 status_code=response.status_code,
-                error_data=data,
+                error_data=_error_data(response),
             )
-        return data
+        return content
+
+    def _get_data(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        *,
+        no_cache: bool = False,
+    ) -> Any:
+        return orjson.loads(
+            self._get_json_bytes(endpoint, query, operation, no_cache=no_cache)
+        )
 
-    def get_health(self) -> dict[str, Any]:
-        data = self._get_data("/health", None, "Get health")
+    def _iter_items(
+        self,
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+        model: type[_ModelT],
+    ) -> Iterator[_ModelT]:
+        """Stream a JSON array response, validating one element at a time.
+
+        Opening the stream is retried like any other request, but the body
+        bypasses the response cache, and a connection lost mid-stream ends the
+        iteration with the error.
+        """
+        build = model.from_trusted if self._trust_server else model.model_validate
+        response = self._send(
+            endpoint,
+            _normalize_params(query) if query is not None else None,
+            stream=True,
+        )
+        try:
+            if not response.is_success:
+                response.read()
+                raise GammaRequestError(
+                    f"[GammaClient] {operation} failed: status {response.status_code}",
+                    status_code=response.status_code,
+                    error_data=_error_data(response),
+                )
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield build(item)
+                del items[:]
+            parser.close()
+            for item in items:
+                yield build(item)
+        finally:
+            response.close()
+
+    def _get_list(
+        self,
+        adapter: TypeAdapter[list[_ModelT]],
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+    ) -> list[_ModelT]:
+        content = self._get_json_bytes(endpoint, query, operation)
+        if self._trust_server:
+            model = _ADAPTER_MODELS[adapter]
+            return [model.from_trusted(item) for item in orjson.loads(content)]
+        return adapter.validate_json(content)
+
+    def _get_model(
+        self,
+        model: type[_ModelT],
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+    ) -> _ModelT:
+        content = self._get_json_bytes(endpoint, query, operation)
+        if self._trust_server:
+            return model.from_trusted_json(content)
+        return model.model_validate_json(content)
+
+    def _get_optional_model(
+        self,
+        model: type[_ModelT],
+        endpoint: str,
+        query: BaseModel | Mapping[str, Any] | None,
+        operation: str,
+    ) -> _ModelT | None:
+        content = self._get_optional_json_bytes(endpoint, query, operation)
+        if content is None:
+            return None
+        if self._trust_server:
+            return model.from_trusted_json(content)
+        return model.model_validate_json(content)
+
+    def get_health(self, *, force: bool = False) -> dict[str, Any]:
+        """Return ``/health``, reusing a result younger than a few seconds.
+
+        Pass ``force=True`` to always hit the network.
+        """
+        cached = self._health_cache
+        if (
+            not force
+            and cached is not None
+            and time.monotonic() - cached[0] < self._health_ttl
+        ):
+            return dict(cached[1])
+        data = dict(self._get_data(_URL_HEALTH, None, "Get health"))
+        self._health_cache = (time.monotonic(), data)
         return dict(data)
 
     def get_teams(
         self, query: TeamQuery | Mapping[str, Any] | None = None
     ) -> list[Team]:
-        data = self._get_data("/teams", query, "Get teams")
-        return TypeAdapter(list[Team]).validate_python(data)
+        return self._get_list(_TEAMS_ADAPTER, _URL_TEAMS, query, "Get teams")
 
     def get_tags(
         self, query: TagQuery | Mapping[str, Any] | None = None
     ) -> list[UpdatedTag]:
-        data = self._get_data("/tags", query, "Get tags")
-        return TypeAdapter(list[UpdatedTag]).validate_python(data)
+        return self._get_list(_TAGS_ADAPTER, _URL_TAGS, query, "Get tags")
 
+    @_instance_lru
     def get_tag_by_id(
         self, tag_id: int, query: TagByIdQuery | Mapping[str, Any] | None = None
     ) -> UpdatedTag | None:
-        data = self._get_optional_data(f"/tags/{tag_id}", query, "Get tag by ID")
-        if data is None:
-            return None
-        return UpdatedTag.model_validate(data)
+        return self._get_optional_model(
+            UpdatedTag, _URL_TAG_BY_ID(tag_id), query, "Get tag by ID"
+        )
 
+    @_instance_lru
     def get_tag_by_slug(
         self, slug: str, query: TagByIdQuery | Mapping[str, Any] | None = None
     ) -> UpdatedTag | None:
-        data = self._get_optional_data(f"/tags/slug/{slug}", query, "Get tag by slug")
-        if data is None:
-            return None
-        return UpdatedTag.model_validate(data)
+        return self._get_optional_model(
+            UpdatedTag, _URL_TAG_BY_SLUG(slug), query, "Get tag by slug"
+        )
 
     def get_related_tags_relationships_by_tag_id(
         self, tag_id: int, query: RelatedTagsQuery | Mapping[str, Any] | None = None
     ) -> list[RelatedTagRelationship]:
-        data = self._get_data(
-            f"/tags/{tag_id}/related-tags", query, "Get related tags relationships"
+        return self._get_list(
+            _RELATED_TAGS_ADAPTER,
+            _URL_RELATED_TAGS_BY_ID(tag_id),
+            query,
+            "Get related tags relationships",
         )
-        return TypeAdapter(list[RelatedTagRelationship]).validate_python(data)
 
     def get_related_tags_relationships_by_tag_slug(
         self, slug: str, query: RelatedTagsQuery | Mapping[str, Any] | None = None
     ) -> list[RelatedTagRelationship]:
-        data = self._get_data(
-            f"/tags/slug/{slug}/related-tags", query, "Get related tags relationships"
+        return self._get_list(
+            _RELATED_TAGS_ADAPTER,
+            _URL_RELATED_TAGS_BY_SLUG(slug),
+            query,
+            "Get related tags relationships",
         )
-        return TypeAdapter(list[RelatedTagRelationship]).validate_python(data)
 
     def get_tags_related_to_tag_id(
         self, tag_id: int, query: RelatedTagsQuery | Mapping[str, Any] | None = None
     ) -> list[UpdatedTag]:
-        data = self._get_data(
-            f"/tags/{tag_id}/related-tags/tags", query, "Get related tags"
+        return self._get_list(
+            _TAGS_ADAPTER,
+            _URL_TAGS_RELATED_TO_ID(tag_id),
+            query,
+            "Get related tags",
         )
-        return TypeAdapter(list[UpdatedTag]).validate_python(data)
 
     def get_tags_related_to_tag_slug(
         self, slug: str, query: RelatedTagsQuery | Mapping[str, Any] | None = None
     ) -> list[UpdatedTag]:
-        data = self._get_data(
-            f"/tags/slug/{slug}/related-tags/tags", query, "Get related tags"
+        return self._get_list(
+            _TAGS_ADAPTER,
+            _URL_TAGS_RELATED_TO_SLUG(slug),
+            query,
+            "Get related tags",
         )
-        return TypeAdapter(list[UpdatedTag]).validate_python(data)
 
     def get_events(
         self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
     ) -> list[Event]:
-        data = self._get_data("/events", query, "Get events")
-        return TypeAdapter(list[Event]).validate_python(data)
+        return self._get_list(_EVENTS_ADAPTER, _URL_EVENTS, query, "Get events")
+
+    def iter_events(
+        self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
+    ) -> Iterator[Event]:
+        return self._iter_items(_URL_EVENTS, query, "Get events", Event)
 
     def get_events_paginated(
         self, query: PaginatedEventQuery | Mapping[str, Any]
     ) -> PaginatedEventsResponse:
-        data = self._get_data("/events/pagination", query, "Get paginated events")
-        return PaginatedEventsResponse.model_validate(data)
+        return self._get_model(
+            PaginatedEventsResponse,
+            _URL_EVENTS_PAGINATION,
+            query,
+            "Get paginated events",
+        )
 
+    @_instance_lru
     def get_event_by_id(
         self, event_id: int, query: EventByIdQuery | Mapping[str, Any] | None = None
     ) -> Event | None:
-        data = self._get_optional_data(f"/events/{event_id}", query, "Get event by ID")
-        if data is None:
-            return None
-        return Event.model_validate(data)
+        return self._get_optional_model(
+            Event, _URL_EVENT_BY_ID(event_id), query, "Get event by ID"
+        )
 
     def get_event_tags(self, event_id: int) -> list[UpdatedTag]:
-        data = self._get_data(f"/events/{event_id}/tags", None, "Get event tags")
-        return TypeAdapter(list[UpdatedTag]).validate_python(data)
+        return self._get_list(
+            _TAGS_ADAPTER, _URL_EVENT_TAGS(event_id), None, "Get event tags"
+        )
 
+    @_instance_lru
     def get_event_by_slug(
         self, slug: str, query: EventByIdQuery | Mapping[str, Any] | None = None
     ) -> Event | None:
-        data = self._get_optional_data(
-            f"/events/slug/{slug}", query, "Get event by slug"
+        return self._get_optional_model(
+            Event, _URL_EVENT_BY_SLUG(slug), query, "Get event by slug"
         )
-        if data is None:
-            return None
-        return Event.model_validate(data)
 
     def get_markets(
         self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
     ) -> list[Market]:
-        data = self._get_data("/markets", query, "Get markets")
-        return TypeAdapter(list[Market]).validate_python(data)
+        return self._get_list(_MARKETS_ADAPTER, _URL_MARKETS, query, "Get markets")
+
+    def iter_markets(
+        self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
+    ) -> Iterator[Market]:
+        return self._iter_items(_URL_MARKETS, query, "Get markets", Market)
 
+    @_instance_lru
     def get_market_by_id(
         self, market_id: int, query: MarketByIdQuery | Mapping[str, Any] | None = None
     ) -> Market | None:
-        data = self._get_optional_data(
-            f"/markets/{market_id}", query, "Get market by ID"
+        return self._get_optional_model(
+            Market, _URL_MARKET_BY_ID(market_id), query, "Get market by ID"
         )
-        if data is None:
-            return None
-        return Market.model_validate(data)
 
     def get_market_tags(self, market_id: int) -> list[UpdatedTag]:
-        data = self._get_data(f"/markets/{market_id}/tags", None, "Get market tags")
-        return TypeAdapter(list[UpdatedTag]).validate_python(data)
+        return self._get_list(
+            _TAGS_ADAPTER, _URL_MARKET_TAGS(market_id), None, "Get market tags"
+        )
 
+    @_instance_lru
     def get_market_by_slug(
         self, slug: str, query: MarketByIdQuery | Mapping[str, Any] | None = None
     ) -> Market | None:
-        data = self._get_optional_data(
-            f"/markets/slug/{slug}", query, "Get market by slug"
+        return self._get_optional_model(
+            Market, _URL_MARKET_BY_SLUG(slug), query, "Get market by slug"
         )
-        if data is None:
-            return None
-        return Market.model_validate(data)
 
     def get_series(self, query: SeriesQuery | Mapping[str, Any]) -> list[Series]:
-        data = self._get_data("/series", query, "Get series")
-        return TypeAdapter(list[Series]).validate_python(data)
+        return self._get_list(_SERIES_ADAPTER, _URL_SERIES, query, "Get series")
+
+    def iter_series(self, query: SeriesQuery | Mapping[str, Any]) -> Iterator[Series]:
+        return self._iter_items(_URL_SERIES, query, "Get series", Series)
 
     def get_series_by_id(
         self, series_id: int, query: SeriesByIdQuery | Mapping[str, Any] | None = None
     ) -> Series | None:
-        data = self._get_optional_data(
-            f"/series/{series_id}", query, "Get series by ID"
+        return self._get_optional_model(
+            Series, _URL_SERIES_BY_ID(series_id), query, "Get series by ID"
         )
-        if data is None:
-            return None
-        return Series.model_validate(data)
 
     def get_comments(
         self, query: CommentQuery | Mapping[str, Any] | None = None
     ) -> list[Comment]:
-        data = self._get_data("/comments", query, "Get comments")
-        return TypeAdapter(list[Comment]).validate_python(data)
+        return self._get_list(_COMMENTS_ADAPTER, _URL_COMMENTS, query, "Get comments")
+
+    def iter_comments(
+        self, query: CommentQuery | Mapping[str, Any] | None = None
+    ) -> Iterator[Comment]:
+        return self._iter_items(_URL_COMMENTS, query, "Get comments", Comment)
 
     def get_comments_by_comment_id(
         self, comment_id: int, query: CommentByIdQuery | Mapping[str, Any] | None = None
     ) -> list[Comment]:
-        data = self._get_data(
-            f"/comments/{comment_id}", query, "Get comments by comment ID"
+        return self._get_list(
+            _COMMENTS_ADAPTER,
+            _URL_COMMENT_BY_ID(comment_id),
+            query,
+            "Get comments by comment ID",
         )
-        return TypeAdapter(list[Comment]).validate_python(data)
 
     def get_comments_by_user_address(
         self,
         user_address: str,
         query: CommentsByUserQuery | Mapping[str, Any] | None = None,
     ) -> list[Comment]:
-        data = self._get_data(
-            f"/comments/user_address/{user_address}",
+        return self._get_list(
+            _COMMENTS_ADAPTER,
+            _URL_COMMENTS_BY_USER(user_address),
             query,
             "Get comments by user address",
         )
-        return TypeAdapter(list[Comment]).validate_python(data)
 
     def search(self, query: SearchQuery | Mapping[str, Any]) -> SearchResponse:
-        data = self._get_data("/public-search", query, "Search")
-        return SearchResponse.model_validate(data)
+        return self._get_model(SearchResponse, _URL_PUBLIC_SEARCH, query, "Search")
 
     def get_active_events(
         self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
     ) -> list[Event]:
-        if query is None:
-            query = UpdatedEventQuery(active=True)
-        elif isinstance(query, UpdatedEventQuery):
-            query.active = True
-        else:
-            query = {**dict(query), "active": True}
-        return self.get_events(query)
+        return self.get_events(_with_flag(query, active=True))
 
     def get_closed_events(
         self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
     ) -> list[Event]:
-        if query is None:
-            query = UpdatedEventQuery(closed=True)
-        elif isinstance(query, UpdatedEventQuery):
-            query.closed = True
-        else:
-            query = {**dict(query), "closed": True}
-        return self.get_events(query)
+        return self.get_events(_with_flag(query, closed=True))
 
     def get_featured_events(
         self, query: UpdatedEventQuery | Mapping[str, Any] | None = None
     ) -> list[Event]:
-        if query is None:
-            query = UpdatedEventQuery(featured=True)
-        elif isinstance(query, UpdatedEventQuery):
-            query.featured = True
-        else:
-            query = {**dict(query), "featured": True}
-        return self.get_events(query)
+        return self.get_events(_with_flag(query, featured=True))
 
     def get_active_markets(
         self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
     ) -> list[Market]:
-        if query is None:
-            query = UpdatedMarketQuery(active=True)
-        elif isinstance(query, UpdatedMarketQuery):
-            query.active = True
-        else:
-            query = {**dict(query), "active": True}
-        return self.get_markets(query)
+        return self.get_markets(_with_flag(query, active=True))
 
     def get_closed_markets(
         self, query: UpdatedMarketQuery | Mapping[str, Any] | None = None
     ) -> list[Market]:
-        if query is None:
-            query = UpdatedMarketQuery(closed=True)
-        elif isinstance(query, UpdatedMarketQuery):
-            query.closed = True
-        else:
-            query = {**dict(query), "closed": True}
-        return self.get_markets(query)
+        return self.get_markets(_with_flag(query, closed=True))
 
 
 GammaSDK = GammaClient
+
+_DEFAULT: GammaClient | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_default_client() -> GammaClient:
+    """Return a process-wide ``GammaClient`` so short-lived callers share keep-alive.
+
+    The shared client is closed at interpreter exit; do not close it yourself or
+    use it as a context manager.
+    """
+    global _DEFAULT
+    if _DEFAULT is None:
+        with _DEFAULT_LOCK:
+            if _DEFAULT is None:
+                _DEFAULT = GammaClient()
+    return _DEFAULT
+
+
+def _close_default_client() -> None:
+    if _DEFAULT is not None:
+        _DEFAULT.close()
+
+
+atexit.register(_close_default_client)
+
+default_client = get_default_client
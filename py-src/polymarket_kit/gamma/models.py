@@ -1,30 +1,148 @@
 from __future__ import annotations
 
-import json
-from typing import Any
-from urllib.parse import urlparse
+import functools
+import sys
+from collections.abc import Callable
+from types import UnionType
+from typing import Annotated, Any, ClassVar, Self, Union, get_args, get_origin
+
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SkipValidation,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+
+# Shared default for the JSON-string list fields, so records that omit them
+# (or send an empty list) don't each allocate an empty container
+_EMPTY: tuple[str, ...] = ()
+
+
+@functools.lru_cache(maxsize=64)
+def _shared_outcomes(outcomes: tuple[str, ...]) -> tuple[str, ...]:
+    """Return one canonical, interned tuple per outcome set, e.g. ``("Yes", "No")``."""
+    return tuple(sys.intern(outcome) for outcome in outcomes)
+
+
+def _parse_json_array(value: Any) -> tuple[str, ...]:
+    # Exact type checks, most frequent first: the API sends JSON strings
+    value_type = type(value)
+    if value_type is str:
+        try:
+            items = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return _EMPTY
+        if type(items) is not list:
+            return _EMPTY
+    elif value_type is list or value_type is tuple:
+        items = value
+    elif value is None:
+        return _EMPTY
+    else:
+        return (str(value),)
+    if not items:
+        return _EMPTY
+    # Already-decoded string items (the common case) are kept as-is
+    if all(type(item) is str for item in items):
+        return tuple(items)
+    return tuple(item if type(item) is str else str(item) for item in items)
+
+
+def _parse_list_field(name: str, value: Any) -> tuple[str, ...]:
+    parsed = _parse_json_array(value)
+    # Only outcomes repeat across records ("Yes"/"No", team names); prices and
+    # token IDs are unique per market, so sharing them would just churn the cache
+    if name == "outcomes" and parsed:
+        return _shared_outcomes(parsed)
+    return parsed
+
+
+# Normalised by ``_coerce_json_arrays`` before validation; skipping the
+# per-field check keeps pydantic from copying the shared tuples
+_StrTuple = Annotated[tuple[str, ...], SkipValidation]
+
+
+def _coerce_json_arrays(data: Any) -> Any:
+    """Decode the JSON-string list fields of a raw market payload in one pass."""
+    if not isinstance(data, dict):
+        return data
+    data = dict(data)
+    for key in ("outcomes", "outcomePrices", "clobTokenIds"):
+        if key in data:
+            parsed = _parse_list_field(key, data[key])
+            if parsed:
+                data[key] = parsed
+            else:
+                # Fall back to the ``_EMPTY`` default
+                del data[key]
+    return data
+
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+class GammaModel(BaseModel):
+    # Unknown keys are dropped and schemas are built on first use rather than
+    # at import; models that need forward-compatible extras opt back in
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, defer_build=True)
 
+    # Fields the API sends as JSON-encoded strings, e.g. ``'["Yes", "No"]'``
+    __json_list_fields__: ClassVar[tuple[str, ...]] = ()
+    # Fields holding nested models (or lists of them) that ``from_trusted``
+    # builds itself instead of leaving raw dicts behind
+    __trusted_nested__: ClassVar[dict[str, type[GammaModel]]] = {}
 
-def _parse_json_array(value: Any) -> list[str]:
-    if value is None:
-        return []
-    if isinstance(value, list):
-        return [str(item) for item in value]
-    if isinstance(value, str):
-        try:
-            parsed = json.loads(value)
-        except json.JSONDecodeError:
-            return []
-        if isinstance(parsed, list):
-            return [str(item) for item in parsed]
-        return []
-    return [str(value)]
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Self:
+        """Build an instance from a Gamma API payload without validation.
+
+        Uses ``model_construct`` so no type coercion runs; only the JSON-string
+        list fields are decoded and nested models are built recursively from
+        ``__trusted_nested__``, i.e. by field, never by guessing from the keys
+        a dict happens to contain.
+        ``data`` is modified in place. Use ``model_validate`` for anything that
+        does not come straight from the API.
+        """
+        for name in cls.__json_list_fields__:
+            if name in data:
+                data[name] = _parse_list_field(name, data[name])
+        for name, model in cls.__trusted_nested__.items():
+            value = data.get(name)
+            if type(value) is list:
+                data[name] = [model.from_trusted(item) for item in value]
+            elif type(value) is dict:
+                data[name] = model.from_trusted(value)
+        return cls.model_construct(**data)
 
+    @classmethod
+    def from_trusted_json(cls, content: bytes) -> Self:
+        """Decode a raw Gamma API response body with :meth:`from_trusted`."""
+        return cls.from_trusted(orjson.loads(content))
+
+    # Low-cardinality labels repeated across thousands of records share one
+    # str object each; check_fields=False lets subclasses opt in by field name
+    @field_validator(
+        "league",
+        "ticker",
+        "seriesSlug",
+        "recurrence",
+        "relationshipType",
+        "umaResolutionStatus",
+        "gmpChartMode",
+        mode="before",
+        check_fields=False,
+    )
+    @classmethod
+    def _intern_labels(cls, value: Any) -> Any:
+        return sys.intern(value) if type(value) is str else value
 
-class GammaModel(BaseModel):
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    # End-of-stream pages all share the frozen ``_EMPTY_PAGINATION`` instance
+    @field_validator("pagination", mode="before", check_fields=False)
+    @classmethod
+    def _reuse_empty_pagination(cls, value: Any) -> Any:
+        # Instances pass through pydantic unchanged, so the singleton survives
+        return _EMPTY_PAGINATION if value == _EMPTY_PAGINATION_DATA else value
 
 
 class ProxyConfig(GammaModel):
@@ -34,7 +152,8 @@ class ProxyConfig(GammaModel):
     password: str | None = None
     protocol: str | None = None
 
-    def to_url(self) -> str:
+    @property
+    def url(self) -> str:
         protocol = self.protocol or "http"
         if self.username and self.password:
             return (
@@ -42,8 +161,14 @@ class ProxyConfig(GammaModel):
             )
         return f"{protocol}://{self.host}:{self.port}"
 
+    def to_url(self) -> str:
+        return self.url
+
     @classmethod
-    def from_url(cls, proxy_url: str) -> "ProxyConfig":
+    def from_url(cls, proxy_url: str) -> ProxyConfig:
+        # Only needed here, once per client; keep it off the import path
+        from urllib.parse import urlparse
+
         parsed = urlparse(proxy_url)
         if not parsed.hostname:
             raise ValueError("Proxy URL must include a hostname")
@@ -105,6 +230,8 @@ class RelatedTagRelationship(GammaModel):
     targetTag: UpdatedTag
     relationship: TagRelationship
 
+    __trusted_nested__ = {"targetTag": UpdatedTag, "relationship": TagRelationship}
+
 
 class EventMarket(GammaModel):
     id: str
@@ -118,8 +245,8 @@ class EventMarket(GammaModel):
     image: str | None = None
     icon: str | None = None
     description: str
-    outcomes: list[str] = Field(default_factory=list)
-    outcomePrices: list[str] = Field(default_factory=list)
+    outcomes: _StrTuple = _EMPTY
+    outcomePrices: _StrTuple = _EMPTY
     volume: str | None = None
     active: bool
     closed: bool
@@ -145,7 +272,7 @@ class EventMarket(GammaModel):
     volume1wk: float | int | None = None
     volume1mo: float | int | None = None
     volume1yr: float | int | None = None
-    clobTokenIds: list[str] = Field(default_factory=list)
+    clobTokenIds: _StrTuple = _EMPTY
     spread: float | int | None = None
     oneDayPriceChange: float | int | None = None
     oneHourPriceChange: float | int | None = None
@@ -154,10 +281,12 @@ class EventMarket(GammaModel):
     bestAsk: float | int | None = None
     competitive: float | int | None = None
 
-    @field_validator("outcomes", "outcomePrices", "clobTokenIds", mode="before")
+    __json_list_fields__ = ("outcomes", "outcomePrices", "clobTokenIds")
+
+    @model_validator(mode="before")
     @classmethod
-    def _parse_list_fields(cls, value: Any) -> list[str]:
-        return _parse_json_array(value)
+    def _coerce_json_arrays(cls, data: Any) -> Any:
+        return _coerce_json_arrays(data)
 
 
 class SeriesEvent(GammaModel):
@@ -215,8 +344,12 @@ class Series(GammaModel):
     featured: bool | None = None
     restricted: bool | None = None
 
+    __trusted_nested__ = {"events": SeriesEvent}
+
 
 class Event(GammaModel):
+    model_config = ConfigDict(extra="allow")
+
     id: str
     ticker: str | None = None
     slug: str
@@ -269,8 +402,12 @@ class Event(GammaModel):
     deployingTimestamp: str | None = None
     eventMetadata: dict[str, Any] | None = None
 
+    __trusted_nested__ = {"markets": EventMarket, "series": Series, "tags": Tag}
+
 
 class Market(GammaModel):
+    model_config = ConfigDict(extra="allow")
+
     id: str
     question: str
     conditionId: str
@@ -283,8 +420,8 @@ class Market(GammaModel):
     description: str
     active: bool
     volume: str | None = None
-    outcomes: list[str] = Field(default_factory=list)
-    outcomePrices: list[str] = Field(default_factory=list)
+    outcomes: _StrTuple = _EMPTY
+    outcomePrices: _StrTuple = _EMPTY
     closed: bool
     marketMakerAddress: str | None = None
     createdAt: str | None = None
@@ -322,7 +459,7 @@ class Market(GammaModel):
     negRisk: bool | None = None
     negRiskMarketID: str | None = None
     negRiskRequestID: str | None = None
-    clobTokenIds: list[str] = Field(default_factory=list)
+    clobTokenIds: _StrTuple = _EMPTY
     umaBond: str | None = None
     umaReward: str | None = None
     ready: bool | None = None
@@ -354,10 +491,12 @@ class Market(GammaModel):
     feesEnabled: bool | None = None
     events: list[dict[str, Any]] | None = None
 
-    @field_validator("outcomes", "outcomePrices", "clobTokenIds", mode="before")
+    __json_list_fields__ = ("outcomes", "outcomePrices", "clobTokenIds")
+
+    @model_validator(mode="before")
     @classmethod
-    def _parse_list_fields(cls, value: Any) -> list[str]:
-        return _parse_json_array(value)
+    def _coerce_json_arrays(cls, data: Any) -> Any:
+        return _coerce_json_arrays(data)
 
 
 class Comment(GammaModel):
@@ -374,21 +513,91 @@ class Comment(GammaModel):
 
 
 class Pagination(GammaModel):
+    # Frozen so the shared end-of-stream instance can be handed out safely
+    model_config = ConfigDict(frozen=True)
+
     hasMore: bool | None = None
     totalResults: int | None = None
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Self:
+        if data == _EMPTY_PAGINATION_DATA:
+            return _EMPTY_PAGINATION
+        return cls.model_construct(**data)
+
+
+# The "no more results" pagination most polling responses end with
+_EMPTY_PAGINATION_DATA = {"hasMore": False, "totalResults": 0}
+_EMPTY_PAGINATION = Pagination.model_construct(**_EMPTY_PAGINATION_DATA)
+
+
+# Search hits are partial objects (untyped in the TS and Go clients), so every
+# field is optional and anything else sent is kept as an extra
+class SearchEvent(GammaModel):
+    model_config = ConfigDict(extra="allow")
+
+    id: str | None = None
+    ticker: str | None = None
+    slug: str | None = None
+    title: str | None = None
+    description: str | None = None
+    image: str | None = None
+    icon: str | None = None
+    active: bool | None = None
+    closed: bool | None = None
+    archived: bool | None = None
+    startDate: str | None = None
+    endDate: str | None = None
+    volume: float | None = None
+    liquidity: float | None = None
+    volume24hr: float | None = None
+    competitive: float | None = None
+    markets: list[dict[str, Any]] | None = None
+    tags: list[dict[str, Any]] | None = None
+
+
+class SearchTag(GammaModel):
+    model_config = ConfigDict(extra="allow")
+
+    id: str | None = None
+    label: str | None = None
+    slug: str | None = None
+    event_count: int | None = None
+
+
+class SearchProfile(GammaModel):
+    # Profile payloads vary between accounts; keep whatever else is sent
+    model_config = ConfigDict(extra="allow")
+
+    id: str | None = None
+    name: str | None = None
+    pseudonym: str | None = None
+    proxyWallet: str | None = None
+    bio: str | None = None
+    profileImage: str | None = None
+    displayUsernamePublic: bool | None = None
+
 
 class SearchResponse(GammaModel):
-    events: list[Any] | None = None
-    tags: list[Any] | None = None
-    profiles: list[Any] | None = None
+    events: list[SearchEvent] | None = None
+    tags: list[SearchTag] | None = None
+    profiles: list[SearchProfile] | None = None
     pagination: Pagination | None = None
 
+    __trusted_nested__ = {
+        "events": SearchEvent,
+        "tags": SearchTag,
+        "profiles": SearchProfile,
+        "pagination": Pagination,
+    }
+
 
 class PaginatedEventsResponse(GammaModel):
     data: list[Event] = Field(default_factory=list)
     pagination: Pagination
 
+    __trusted_nested__ = {"data": Event, "pagination": Pagination}
+
 
 class GammaError(GammaModel):
     message: str
@@ -408,7 +617,72 @@ class IPResponse(GammaModel):
     hostname: str | None = None
 
 
-class TeamQuery(GammaModel):
+def _stringify_param(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _annotation_members(annotation: Any) -> tuple[Any, ...]:
+    if get_origin(annotation) in (Union, UnionType):
+        return tuple(arg for arg in get_args(annotation) if arg is not type(None))
+    return (annotation,)
+
+
+def _compile_to_params(model_cls: type[BaseModel]) -> Callable[[Any], dict[str, Any]]:
+    """Compile a straight-line ``model -> params`` function for a query model.
+
+    Equivalent to stringifying ``query.model_dump(exclude_none=True)`` for
+    flat query models, but each field's list/bool/scalar branch is decided once
+    here instead of on every request. Extra keys are left to the caller.
+    """
+    lines = ["def __to_params__(model):", "    params = {}"]
+    for name, field in model_cls.model_fields.items():
+        members = _annotation_members(field.annotation)
+        lines.append(f"    value = model.{name}")
+        lines.append("    if value is not None:")
+        if any(get_origin(member) in (list, tuple, set) for member in members):
+            lines.append("        if isinstance(value, (list, tuple, set)):")
+            lines.append(
+                f"            params[{name!r}] = "
+                "[_stringify_param(item) for item in value if item is not None]"
+            )
+            lines.append("        else:")
+            lines.append(f"            params[{name!r}] = _stringify_param(value)")
+        elif members == (bool,):
+            lines.append(
+                f"        params[{name!r}] = 'true' if value is True else "
+                "'false' if value is False else str(value)"
+            )
+        else:
+            lines.append(f"        params[{name!r}] = _stringify_param(value)")
+    lines.append("    return params")
+
+    namespace: dict[str, Any] = {"_stringify_param": _stringify_param}
+    # The source is built above from the class's own field names, never from
+    # request data; closures would reintroduce the per-field branching
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["__to_params__"]
+
+
+class QueryModel(GammaModel):
+    # Extra keys are forwarded to the API as additional query parameters
+    model_config = ConfigDict(extra="allow")
+
+    # Returns the declared, non-None fields as request params; generated from
+    # each class's fields when the class is defined
+    __to_params__: ClassVar[Callable[[Any], dict[str, Any]]]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__to_params__ = _compile_to_params(cls)
+
+
+QueryModel.__to_params__ = _compile_to_params(QueryModel)
+
+
+class TeamQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
@@ -418,7 +692,7 @@ class TeamQuery(GammaModel):
     abbreviation: list[str] | str | None = None
 
 
-class TagQuery(GammaModel):
+class TagQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
@@ -428,18 +702,18 @@ class TagQuery(GammaModel):
     search: str | None = None
 
 
-class TagByIdQuery(GammaModel):
+class TagByIdQuery(QueryModel):
     include_template: bool | None = None
 
 
-class RelatedTagsQuery(GammaModel):
+class RelatedTagsQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
     ascending: bool | None = None
 
 
-class UpdatedEventQuery(GammaModel):
+class UpdatedEventQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
@@ -462,7 +736,7 @@ class UpdatedEventQuery(GammaModel):
     end_date_max: str | None = None
 
 
-class PaginatedEventQuery(GammaModel):
+class PaginatedEventQuery(QueryModel):
     limit: int
     offset: int
     order: str | None = None
@@ -472,12 +746,12 @@ class PaginatedEventQuery(GammaModel):
     recurrence: str | None = None
 
 
-class EventByIdQuery(GammaModel):
+class EventByIdQuery(QueryModel):
     include_chat: bool | None = None
     include_template: bool | None = None
 
 
-class UpdatedMarketQuery(GammaModel):
+class UpdatedMarketQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
@@ -495,11 +769,11 @@ class UpdatedMarketQuery(GammaModel):
     end_date_max: str | None = None
 
 
-class MarketByIdQuery(GammaModel):
+class MarketByIdQuery(QueryModel):
     include_tag: bool | None = None
 
 
-class SeriesQuery(GammaModel):
+class SeriesQuery(QueryModel):
     limit: int
     offset: int
     order: str | None = None
@@ -512,11 +786,11 @@ class SeriesQuery(GammaModel):
     recurrence: str | None = None
 
 
-class SeriesByIdQuery(GammaModel):
+class SeriesByIdQuery(QueryModel):
     include_chat: bool | None = None
 
 
-class CommentQuery(GammaModel):
+class CommentQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
@@ -527,18 +801,18 @@ class CommentQuery(GammaModel):
     holders_only: bool | None = None
 
 
-class CommentByIdQuery(GammaModel):
+class CommentByIdQuery(QueryModel):
     get_positions: bool | None = None
 
 
-class CommentsByUserQuery(GammaModel):
+class CommentsByUserQuery(QueryModel):
     limit: int | None = None
     offset: int | None = None
     order: str | None = None
     ascending: bool | None = None
 
 
-class SearchQuery(GammaModel):
+class SearchQuery(QueryModel):
     q: str
     cache: bool | None = None
     events_status: str | None = None
@@ -547,3 +821,13 @@ class SearchQuery(GammaModel):
     events_tag: list[str] | str | None = None
     sort: str | None = None
     ascending: bool | None = None
+
+
+# Shared list validators for the bulk event/market endpoints; reusing one
+# adapter keeps the compiled schema alive instead of rebuilding it per call
+EVENT_LIST: TypeAdapter[list[Event]] = TypeAdapter(
+    list[Event], config=ConfigDict(defer_build=True)
+)
+MARKET_LIST: TypeAdapter[list[Market]] = TypeAdapter(
+    list[Market], config=ConfigDict(defer_build=True)
+)
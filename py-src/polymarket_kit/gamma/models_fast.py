@@ -0,0 +1,359 @@
+"""
+msgspec mirrors of the Gamma wire models
+
+Decodes raw response bytes straight into ``msgspec.Struct`` instances in a
+single C pass, skipping pydantic's validation machinery entirely. Use these
+for bulk reads (large event/market listings); the pydantic classes in
+:mod:`polymarket_kit.gamma.models` remain the source of truth for query
+parameters and anything that needs validation.
+
+Requires the optional ``msgspec`` dependency::
+
+    pip install "polymarket-kit[fast]"
+
+Example:
+    ```python
+    from polymarket_kit.gamma import GammaClient
+    from polymarket_kit.gamma.models_fast import decode_events
+
+    gamma = GammaClient()
+    response = gamma.http_client.get("/events", params={"limit": 500})
+    events = decode_events(response.content)
+    ```
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+try:
+    import msgspec
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "msgspec is required for polymarket_kit.gamma.models_fast; install it "
+        'with `pip install "polymarket-kit[fast]"`'
+    ) from exc
+
+from .models import _parse_list_field
+
+
+class FastModel(msgspec.Struct, kw_only=True, omit_defaults=True):
+    # Fields the API sends as JSON-encoded strings, e.g. ``'["Yes", "No"]'``;
+    # they are decoded to ``tuple[str, ...]`` values right after construction
+    __json_list_fields__: ClassVar[tuple[str, ...]] = ()
+
+    def __post_init__(self) -> None:
+        for name in self.__json_list_fields__:
+            setattr(self, name, _parse_list_field(name, getattr(self, name)))
+
+
+class Tag(FastModel, kw_only=True):
+    id: str
+    label: str
+    slug: str
+    forceShow: bool | None = None
+    createdAt: str | None = None
+    isCarousel: bool | None = None
+
+
+class EventMarket(FastModel, kw_only=True):
+    __json_list_fields__ = ("outcomes", "outcomePrices", "clobTokenIds")
+
+    id: str
+    question: str
+    conditionId: str
+    slug: str
+    resolutionSource: str | None = None
+    endDate: str | None = None
+    liquidity: str | None = None
+    startDate: str | None = None
+    image: str | None = None
+    icon: str | None = None
+    description: str
+    outcomes: tuple[str, ...] | str | None = ()
+    outcomePrices: tuple[str, ...] | str | None = ()
+    volume: str | None = None
+    active: bool
+    closed: bool
+    marketMakerAddress: str | None = None
+    createdAt: str
+    updatedAt: str | None = None
+    new: bool | None = None
+    featured: bool | None = None
+    archived: bool | None = None
+    restricted: bool | None = None
+    groupItemTitle: str | None = None
+    groupItemThreshold: str | None = None
+    questionID: str | None = None
+    enableOrderBook: bool | None = None
+    orderPriceMinTickSize: float | None = None
+    orderMinSize: float | None = None
+    volumeNum: float | None = None
+    liquidityNum: float | None = None
+    endDateIso: str | None = None
+    startDateIso: str | None = None
+    hasReviewedDates: bool | None = None
+    volume24hr: float | None = None
+    volume1wk: float | None = None
+    volume1mo: float | None = None
+    volume1yr: float | None = None
+    clobTokenIds: tuple[str, ...] | str | None = ()
+    spread: float | None = None
+    oneDayPriceChange: float | None = None
+    oneHourPriceChange: float | None = None
+    lastTradePrice: float | None = None
+    bestBid: float | None = None
+    bestAsk: float | None = None
+    competitive: float | None = None
+
+
+class SeriesEvent(FastModel, kw_only=True):
+    id: str
+    slug: str
+    title: str
+    resolutionSource: str | None = None
+    endDate: str | None = None
+    startDate: str | None = None
+    image: str | None = None
+    icon: str | None = None
+    description: str
+    volume: float | None = None
+    liquidity: float | None = None
+    active: bool
+    closed: bool
+    createdAt: str
+    updatedAt: str | None = None
+    new: bool | None = None
+    featured: bool | None = None
+    archived: bool | None = None
+    restricted: bool | None = None
+    enableOrderBook: bool | None = None
+    volume24hr: float | None = None
+    volume1wk: float | None = None
+    volume1mo: float | None = None
+    volume1yr: float | None = None
+    competitive: float | None = None
+
+
+class Series(FastModel, kw_only=True):
+    id: str
+    ticker: str | None = None
+    slug: str
+    title: str
+    subtitle: str | None = None
+    seriesType: str | None = None
+    recurrence: str | None = None
+    image: str | None = None
+    icon: str | None = None
+    active: bool
+    closed: bool
+    archived: bool | None = None
+    events: list[SeriesEvent] | None = None
+    volume: float | None = None
+    liquidity: float | None = None
+    startDate: str | None = None
+    createdAt: str
+    updatedAt: str | None = None
+    competitive: float | str | None = None
+    volume24hr: float | None = None
+    pythTokenID: str | None = None
+    cgAssetName: str | None = None
+    commentCount: int | None = None
+    featured: bool | None = None
+    restricted: bool | None = None
+
+
+class Event(FastModel, kw_only=True):
+    id: str
+    ticker: str | None = None
+    slug: str
+    title: str
+    description: str | None = None
+    resolutionSource: str | None = None
+    startDate: str | None = None
+    creationDate: str | None = None
+    endDate: str | None = None
+    image: str
+    icon: str
+    active: bool
+    closed: bool
+    archived: bool | None = None
+    new: bool | None = None
+    featured: bool | None = None
+    restricted: bool | None = None
+    liquidity: float | None = None
+    volume: float | None = None
+    openInterest: float | None = None
+    createdAt: str
+    updatedAt: str | None = None
+    competitive: float | None = None
+    volume24hr: float | None = None
+    volume1wk: float | None = None
+    volume1mo: float | None = None
+    volume1yr: float | None = None
+    enableOrderBook: bool | None = None
+    liquidityClob: float | None = None
+    negRisk: bool | None = None
+    commentCount: int | None = None
+    markets: list[EventMarket] = []
+    series: list[Series] | None = None
+    tags: list[Tag] | None = None
+    cyom: bool | None = None
+    showAllOutcomes: bool | None = None
+    showMarketImages: bool | None = None
+    enableNegRisk: bool | None = None
+    automaticallyActive: bool | None = None
+    seriesSlug: str | None = None
+    gmpChartMode: str | None = None
+    negRiskAugmented: bool | None = None
+    pendingDeployment: bool | None = None
+    deploying: bool | None = None
+    sortBy: str | None = None
+    closedTime: str | None = None
+    liquidityAmm: float | None = None
+    automaticallyResolved: bool | None = None
+    negRiskMarketID: str | None = None
+    deployingTimestamp: str | None = None
+    eventMetadata: dict[str, Any] | None = None
+
+
+class Market(FastModel, kw_only=True):
+    __json_list_fields__ = ("outcomes", "outcomePrices", "clobTokenIds")
+
+    id: str
+    question: str
+    conditionId: str
+    slug: str
+    endDate: str | None = None
+    liquidity: str | None = None
+    startDate: str | None = None
+    image: str
+    icon: str
+    description: str
+    active: bool
+    volume: str | None = None
+    outcomes: tuple[str, ...] | str | None = ()
+    outcomePrices: tuple[str, ...] | str | None = ()
+    closed: bool
+    marketMakerAddress: str | None = None
+    createdAt: str | None = None
+    updatedAt: str | None = None
+    closedTime: str | None = None
+    new: bool | None = None
+    featured: bool | None = None
+    submitted_by: str | None = None
+    archived: bool | None = None
+    resolvedBy: str | None = None
+    restricted: bool | None = None
+    groupItemTitle: str | None = None
+    groupItemThreshold: str | None = None
+    questionID: str | None = None
+    umaEndDate: str | None = None
+    enableOrderBook: bool | None = None
+    orderPriceMinTickSize: float | None = None
+    orderMinSize: float | None = None
+    umaResolutionStatus: str | None = None
+    volumeNum: float | None = None
+    liquidityNum: float | None = None
+    endDateIso: str | None = None
+    startDateIso: str | None = None
+    hasReviewedDates: bool | None = None
+    volume24hr: float | None = None
+    volume1wk: float | None = None
+    volume1mo: float | None = None
+    volume1yr: float | None = None
+    volume1wkClob: float | None = None
+    volume1moClob: float | None = None
+    volume1yrClob: float | None = None
+    volumeClob: float | None = None
+    customLiveness: float | None = None
+    acceptingOrders: bool | None = None
+    negRisk: bool | None = None
+    negRiskMarketID: str | None = None
+    negRiskRequestID: str | None = None
+    clobTokenIds: tuple[str, ...] | str | None = ()
+    umaBond: str | None = None
+    umaReward: str | None = None
+    ready: bool | None = None
+    funded: bool | None = None
+    acceptingOrdersTimestamp: str | None = None
+    cyom: bool | None = None
+    pagerDutyNotificationEnabled: bool | None = None
+    approved: bool | None = None
+    rewardsMinSize: float | None = None
+    rewardsMaxSpread: float | None = None
+    spread: float | None = None
+    automaticallyResolved: bool | None = None
+    oneWeekPriceChange: float | None = None
+    oneMonthPriceChange: float | None = None
+    lastTradePrice: float | None = None
+    bestAsk: float | None = None
+    automaticallyActive: bool | None = None
+    clearBookOnStart: bool | None = None
+    showGmpSeries: bool | None = None
+    showGmpOutcome: bool | None = None
+    manualActivation: bool | None = None
+    negRiskOther: bool | None = None
+    umaResolutionStatuses: str | None = None
+    pendingDeployment: bool | None = None
+    deploying: bool | None = None
+    deployingTimestamp: str | None = None
+    rfqEnabled: bool | None = None
+    holdingRewardsEnabled: bool | None = None
+    feesEnabled: bool | None = None
+    events: list[dict[str, Any]] | None = None
+
+
+class Comment(FastModel, kw_only=True):
+    id: str
+    body: str
+    parentEntityType: str
+    parentEntityID: int
+    userAddress: str
+    createdAt: str
+    profile: Any | None = None
+    reactions: list[Any] | None = None
+    reportCount: int
+    reactionCount: int
+
+
+class Pagination(FastModel, kw_only=True):
+    hasMore: bool | None = None
+    totalResults: int | None = None
+
+
+class PaginatedEventsResponse(FastModel, kw_only=True):
+    data: list[Event] = []
+    pagination: Pagination
+
+
+_EVENTS_DECODER = msgspec.json.Decoder(list[Event], strict=False)
+_MARKETS_DECODER = msgspec.json.Decoder(list[Market], strict=False)
+_SERIES_DECODER = msgspec.json.Decoder(list[Series], strict=False)
+_COMMENTS_DECODER = msgspec.json.Decoder(list[Comment], strict=False)
+_PAGINATED_EVENTS_DECODER = msgspec.json.Decoder(PaginatedEventsResponse, strict=False)
+
+
+def decode_events(content: bytes) -> list[Event]:
+    """Decode a ``/events`` response body"""
+    return _EVENTS_DECODER.decode(content)
+
+
+def decode_markets(content: bytes) -> list[Market]:
+    """Decode a ``/markets`` response body"""
+    return _MARKETS_DECODER.decode(content)
+
+
+def decode_series(content: bytes) -> list[Series]:
+    """Decode a ``/series`` response body"""
+    return _SERIES_DECODER.decode(content)
+
+
+def decode_comments(content: bytes) -> list[Comment]:
+    """Decode a ``/comments`` response body"""
+    return _COMMENTS_DECODER.decode(content)
+
+
+def decode_paginated_events(content: bytes) -> PaginatedEventsResponse:
+    """Decode an ``/events/pagination`` response body"""
+    return _PAGINATED_EVENTS_DECODER.decode(content)
@@ -0,0 +1,129 @@
+"""
+Column-oriented (NumPy) views of Gamma API results
+
+Turns lists of ``Event``/``Market`` models into one NumPy array per numeric
+field so filters and aggregates such as ``table.volume24hr > 1e6`` run as a
+single vectorized pass instead of a Python loop over attribute lookups.
+Missing or empty values become ``nan``.
+
+Requires the optional ``numpy`` dependency::
+
+    pip install "polymarket-kit[numpy]"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .models import Event, EventMarket, Market
+
+if TYPE_CHECKING:
+    import numpy
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "numpy is required for columnar tables; install it with "
+            '`pip install "polymarket-kit[numpy]"`'
+        ) from exc
+    return numpy
+
+
+def _float_column(np: Any, items: Sequence[Any], name: str) -> numpy.ndarray:
+    nan = float("nan")
+    # ``from_trusted`` models keep the raw wire value, which can be ""
+    return np.fromiter(
+        (
+            nan if value is None or value == "" else value
+            for value in (getattr(item, name, None) for item in items)
+        ),
+        dtype=np.float64,
+        count=len(items),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EventTable:
+    """
+    Structure-of-arrays view of a list of events
+
+    Example:
+        ```python
+        events = gamma.get_events({"active": True, "limit": 500})
+        table = EventTable.from_events(events)
+        hot = table.slug[table.volume24hr > 1e6]
+        ```
+    """
+
+    id: numpy.ndarray
+    slug: numpy.ndarray
+    volume: numpy.ndarray
+    liquidity: numpy.ndarray
+    volume24hr: numpy.ndarray
+    competitive: numpy.ndarray
+    openInterest: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @classmethod
+    def from_events(cls, events: Sequence[Event]) -> EventTable:
+        np = _require_numpy()
+        return cls(
+            id=np.array([event.id for event in events], dtype=object),
+            slug=np.array([event.slug for event in events], dtype=object),
+            volume=_float_column(np, events, "volume"),
+            liquidity=_float_column(np, events, "liquidity"),
+            volume24hr=_float_column(np, events, "volume24hr"),
+            competitive=_float_column(np, events, "competitive"),
+            openInterest=_float_column(np, events, "openInterest"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MarketTable:
+    """
+    Structure-of-arrays view of a list of markets
+
+    Accepts ``Market`` results from ``get_markets`` as well as the
+    ``EventMarket`` entries nested in events.
+
+    Example:
+        ```python
+        table = MarketTable.from_markets(gamma.get_markets({"limit": 500}))
+        spread = table.bestAsk - table.bestBid
+        ```
+    """
+
+    id: numpy.ndarray
+    slug: numpy.ndarray
+    volumeNum: numpy.ndarray
+    liquidityNum: numpy.ndarray
+    volume24hr: numpy.ndarray
+    competitive: numpy.ndarray
+    bestBid: numpy.ndarray
+    bestAsk: numpy.ndarray
+    lastTradePrice: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @classmethod
+    def from_markets(cls, markets: Sequence[Market | EventMarket]) -> MarketTable:
+        np = _require_numpy()
+        return cls(
+            id=np.array([market.id for market in markets], dtype=object),
+            slug=np.array([market.slug for market in markets], dtype=object),
+            volumeNum=_float_column(np, markets, "volumeNum"),
+            liquidityNum=_float_column(np, markets, "liquidityNum"),
+            volume24hr=_float_column(np, markets, "volume24hr"),
+            competitive=_float_column(np, markets, "competitive"),
+            bestBid=_float_column(np, markets, "bestBid"),
+            bestAsk=_float_column(np, markets, "bestAsk"),
+            lastTradePrice=_float_column(np, markets, "lastTradePrice"),
+        )
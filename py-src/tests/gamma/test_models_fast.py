@@ -0,0 +1,63 @@
+import orjson
+import pytest
+
+from polymarket_kit.gamma.models import Event, Market
+
+models_fast = pytest.importorskip("polymarket_kit.gamma.models_fast")
+
+# Numeric fields arrive as strings on some endpoints; both paths must accept them
+MARKET = {
+    "id": "1",
+    "question": "Will it rain?",
+    "conditionId": "0xc0",
+    "slug": "will-it-rain",
+    "image": "https://example.com/i.png",
+    "icon": "https://example.com/i.png",
+    "description": "Resolves YES if it rains.",
+    "active": True,
+    "closed": False,
+    "createdAt": "2024-01-01T00:00:00Z",
+    "outcomes": '["Yes", "No"]',
+    "outcomePrices": '["0.4", "0.6"]',
+    "clobTokenIds": '["11", "22"]',
+    "volume": "12.5",
+    "volumeNum": "12.5",
+    "liquidityNum": 3,
+}
+
+EVENT = {
+    "id": "9",
+    "slug": "weather",
+    "title": "Weather",
+    "image": "https://example.com/e.png",
+    "icon": "https://example.com/e.png",
+    "active": True,
+    "closed": False,
+    "createdAt": "2024-01-01T00:00:00Z",
+    "volume": "100.5",
+    "liquidity": "7",
+    "commentCount": "3",
+    "markets": [MARKET],
+    "tags": [{"id": "2", "label": "Weather", "slug": "weather"}],
+}
+
+
+def test_decode_markets_matches_pydantic() -> None:
+    expected = Market.model_validate(MARKET)
+    (decoded,) = models_fast.decode_markets(orjson.dumps([MARKET]))
+
+    for name in ("outcomes", "outcomePrices", "clobTokenIds", "volume"):
+        assert getattr(decoded, name) == getattr(expected, name)
+    assert decoded.volumeNum == expected.volumeNum == 12.5
+    assert decoded.liquidityNum == expected.liquidityNum == 3
+
+
+def test_decode_events_matches_pydantic() -> None:
+    expected = Event.model_validate(EVENT)
+    (decoded,) = models_fast.decode_events(orjson.dumps([EVENT]))
+
+    assert decoded.volume == expected.volume == 100.5
+    assert decoded.liquidity == expected.liquidity == 7
+    assert decoded.commentCount == expected.commentCount == 3
+    assert decoded.markets[0].outcomes == expected.markets[0].outcomes
+    assert decoded.tags[0].slug == expected.tags[0].slug